@@ -7,6 +7,7 @@ from typing import Optional
 import psycopg2
 from psycopg2 import sql
 from psycopg2.extensions import connection
+from psycopg2.pool import ThreadedConnectionPool
 
 # Database connection parameters
 # You can override these with environment variables
@@ -18,20 +19,32 @@ DB_CONFIG = {
     "password": os.getenv("NBA2K_DB_PASSWORD", "postgres"),
 }
 
+def _print_connection_help(error: Exception) -> None:
+    """Print connection details and troubleshooting hints for a failed connect."""
+    print(f"ERROR: Could not connect to PostgreSQL database")
+    print(f"Connection details: {DB_CONFIG['user']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
+    print(f"Error: {error}")
+    print("\nMake sure:")
+    print("  1. PostgreSQL is installed and running")
+    print("  2. Database exists (run: createdb nba2k26)")
+    print("  3. User has correct permissions")
+    print("  4. Password is correct (set NBA2K_DB_PASSWORD env variable)")
+
 def get_connection() -> connection:
     """Create and return a database connection."""
     try:
         conn = psycopg2.connect(**DB_CONFIG)
         return conn
     except psycopg2.OperationalError as e:
-        print(f"ERROR: Could not connect to PostgreSQL database")
-        print(f"Connection details: {DB_CONFIG['user']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
-        print(f"Error: {e}")
-        print("\nMake sure:")
-        print("  1. PostgreSQL is installed and running")
-        print("  2. Database exists (run: createdb nba2k26)")
-        print("  3. User has correct permissions")
-        print("  4. Password is correct (set NBA2K_DB_PASSWORD env variable)")
+        _print_connection_help(e)
+        raise
+
+def create_pool(minconn: int = 1, maxconn: int = 4) -> ThreadedConnectionPool:
+    """Create a thread-safe connection pool for long-running callers (e.g. the desktop app)."""
+    try:
+        return ThreadedConnectionPool(minconn, maxconn, **DB_CONFIG)
+    except psycopg2.OperationalError as e:
+        _print_connection_help(e)
         raise
 
 def test_connection() -> bool:
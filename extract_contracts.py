@@ -121,7 +121,7 @@ def _load_manifest(path: Path) -> List[Dict[str, Any]]:
 def _is_contract_screen(img_bgr: np.ndarray) -> bool:
     """Check if screenshot is a Contract Extensions screen by looking for header text."""
     # Extract header text area (top portion where "Association Contract Extensions" appears)
-    header_roi = img_bgr[20:35, 200:520].copy()
+    header_roi = img_bgr[20:35, 200:520]
     
     gray = cv2.cvtColor(header_roi, cv2.COLOR_BGR2GRAY)
     gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
@@ -140,7 +140,7 @@ def _extract_team_name(img_bgr: np.ndarray) -> str:
     """Extract team name from screenshot using OCR.
     Team name ROI: x=111, y=84, w=268, h=41
     """
-    team_roi = img_bgr[84:125, 111:379].copy()
+    team_roi = img_bgr[84:125, 111:379]
     
     gray = cv2.cvtColor(team_roi, cv2.COLOR_BGR2GRAY)
     if gray.mean() < 127:
@@ -157,7 +157,7 @@ def _extract_team_name(img_bgr: np.ndarray) -> str:
 
 def _crop_roi_bgr(img_bgr: np.ndarray, roi: Tuple[int, int, int, int]) -> np.ndarray:
     x, y, w, h = roi
-    return img_bgr[y:y + h, x:x + w].copy()
+    return img_bgr[y:y + h, x:x + w]
 
 def _save_debug(path: Path, img: np.ndarray) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -322,7 +322,7 @@ def _has_special_icon(line_bgr: np.ndarray) -> bool:
     if w < 40:
         return False
     
-    icon_region = line_bgr[:, :40].copy()
+    icon_region = line_bgr[:, :40]
     hsv = cv2.cvtColor(icon_region, cv2.COLOR_BGR2HSV)
     
     # Detect RED injury icon
@@ -593,7 +593,7 @@ def main() -> None:
         h, w, _ = namecol.shape
         lx = int(w * LEFT_TRIM_RATIO)
         rx = int(w * (1.0 - RIGHT_TRIM_RATIO))
-        namecol_trim = namecol[:, lx:rx].copy()
+        namecol_trim = namecol[:, lx:rx]
         
         if args.debug:
             _save_debug(DEBUG_DIR / f"{Path(fname).stem}__namecol.png", namecol_trim)
@@ -605,7 +605,7 @@ def main() -> None:
             _save_debug(DEBUG_DIR / f"{Path(fname).stem}__mask.png", mask)
 
         for i, (y0, y1) in enumerate(bands):
-            line_bgr = namecol_trim[y0:y1, :].copy()
+            line_bgr = namecol_trim[y0:y1, :]
 
             if line_bgr.shape[0] < 14 or line_bgr.shape[1] < 60:
                 continue
@@ -653,11 +653,11 @@ def main() -> None:
                 print(f"WARNING: Invalid line bounds for {text}: y0={y0}, y1={y1}, salary_height={sal_h}")
                 continue
             
-            salary_line = salarycol[y0:y1, :].copy()
-            option_line = optioncol[y0:y1, :].copy()
-            sign_line = signcol[y0:y1, :].copy()
-            extension_line = extensioncol[y0:y1, :].copy()
-            ntc_line = ntccol[y0:y1, :].copy()
+            salary_line = salarycol[y0:y1, :]
+            option_line = optioncol[y0:y1, :]
+            sign_line = signcol[y0:y1, :]
+            extension_line = extensioncol[y0:y1, :]
+            ntc_line = ntccol[y0:y1, :]
 
             if args.debug:
                 _save_debug(DEBUG_DIR / f"{Path(fname).stem}__line_{i:02d}_salary.png", salary_line)
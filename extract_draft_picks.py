@@ -101,7 +101,7 @@ def _is_draft_picks_screen(img_bgr: np.ndarray) -> bool:
     """Check if screenshot is a Future Draft Picks screen by looking for header text."""
     # Extract wide header area to catch the text
     # Text appears in format like "WNBA FUTURE DRAFT PICKS" or "Association Future Draft Picks"
-    header_roi = img_bgr[10:60, 100:700].copy()
+    header_roi = img_bgr[10:60, 100:700]
     
     gray = cv2.cvtColor(header_roi, cv2.COLOR_BGR2GRAY)
     gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
@@ -121,7 +121,7 @@ def _extract_team_name(img_bgr: np.ndarray) -> str:
     Team name appears just above the column headers (1920x1080 resolution).
     """
     # Team name appears just above column headers around Y 180-250
-    team_roi = img_bgr[180:250, 50:900].copy()
+    team_roi = img_bgr[180:250, 50:900]
     
     gray = cv2.cvtColor(team_roi, cv2.COLOR_BGR2GRAY)
     if gray.mean() < 127:
@@ -147,7 +147,7 @@ def _extract_team_name(img_bgr: np.ndarray) -> str:
 
 def _crop_roi_bgr(img_bgr: np.ndarray, roi: Tuple[int, int, int, int]) -> np.ndarray:
     x, y, w, h = roi
-    return img_bgr[y:y + h, x:x + w].copy()
+    return img_bgr[y:y + h, x:x + w]
 
 def _save_debug(path: Path, img: np.ndarray) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -525,10 +525,10 @@ def main() -> None:
             y1_expanded = min(year_col.shape[0], y1 + 12)
             
             # Extract each field with expanded boundaries from year column position
-            year_line = year_col[y0_expanded:y1_expanded, :].copy()
-            round_line = round_col[y0_expanded:y1_expanded, :].copy()
-            pick_line = pick_col[y0_expanded:y1_expanded, :].copy()
-            protection_line = protection_col[y0_expanded:y1_expanded, :].copy()
+            year_line = year_col[y0_expanded:y1_expanded, :]
+            round_line = round_col[y0_expanded:y1_expanded, :]
+            pick_line = pick_col[y0_expanded:y1_expanded, :]
+            protection_line = protection_col[y0_expanded:y1_expanded, :]
             
             # Find the origin line that's closest to this year line
             # Origin is center-aligned so text may be at different Y position
@@ -549,10 +549,10 @@ def main() -> None:
                 orig_y0, orig_y1 = best_origin_line
                 orig_y0_expanded = max(0, orig_y0 - 12)
                 orig_y1_expanded = min(origin_col.shape[0], orig_y1 + 12)
-                origin_line = origin_col[orig_y0_expanded:orig_y1_expanded, :].copy()
+                origin_line = origin_col[orig_y0_expanded:orig_y1_expanded, :]
             else:
                 # Fallback: use same boundaries as year line
-                origin_line = origin_col[y0_expanded:y1_expanded, :].copy()
+                origin_line = origin_col[y0_expanded:y1_expanded, :]
             
             # OCR each field
             year_bw = _prep_for_ocr(year_line)
@@ -5,10 +5,13 @@ import argparse
 import json
 import re
 import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Iterator, Optional
 
 import numpy as np
 import cv2
@@ -68,6 +71,19 @@ class LineResult:
 
 ROMAN_SET = {"I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X"}
 
+# Candidate (value, confidence) pairs for a lone OCR digit, built once.
+# AGE: 8/9 could be 18/19/28/29/38/39, other digits are tried as 2X and 3X.
+# OVR: tried as 7X, 8X, 9X (NBA players rarely below 70).
+_AGE_FALLBACKS: Dict[int, List[Tuple[int, float]]] = {
+    d: ([(v, 35.0) for v in (10 + d, 20 + d, 30 + d) if 18 <= v <= 45] if d in (8, 9)
+        else [(v, 40.0) for v in (20 + d, 30 + d) if 20 <= v <= 39])
+    for d in range(10)
+}
+_OVR_FALLBACKS: Dict[int, List[Tuple[int, float]]] = {
+    d: [(v, 40.0) for v in (70 + d, 80 + d, 90 + d) if 70 <= v <= 99]
+    for d in range(10)
+}
+
 def _archive_processed_screenshots(processed_files: List[str], screenshot_type: str) -> int:
     """Move processed screenshots to dated archive folder.
     
@@ -99,15 +115,18 @@ def _archive_processed_screenshots(processed_files: List[str], screenshot_type:
     
     return archived_count
 
-def _parse_in_delta(in_cell_bgr: np.ndarray) -> Optional[int]:
+def _parse_in_delta(in_cell_bgr: np.ndarray, in_cell_hsv: Optional[np.ndarray] = None) -> Optional[int]:
     """Parse the IN column to extract rating change delta.
+    Pass in_cell_hsv (the same rows sliced from an HSV copy of the whole IN
+    column) to skip the per-line BGR->HSV conversion.
     Returns: +N for increase (▲), -N for decrease (▼), None if no change.
     """
     h, w = in_cell_bgr.shape[:2]
 
     # Split: left side has arrow, right side has number
-    arrow_roi = in_cell_bgr[:, :int(w * 0.50)].copy()
-    num_roi   = in_cell_bgr[:, int(w * 0.55):].copy()
+    arrow_w = int(w * 0.50)
+    arrow_roi = in_cell_bgr[:, :arrow_w]
+    num_roi   = in_cell_bgr[:, int(w * 0.55):]
 
     # -------------------------
     # 1) Determine sign via COLOR: green = up (+), red = down (-)
@@ -115,7 +134,10 @@ def _parse_in_delta(in_cell_bgr: np.ndarray) -> Optional[int]:
     sign = 0
     
     # Convert to HSV for better color detection
-    hsv = cv2.cvtColor(arrow_roi, cv2.COLOR_BGR2HSV)
+    if in_cell_hsv is not None:
+        hsv = in_cell_hsv[:, :arrow_w]
+    else:
+        hsv = cv2.cvtColor(arrow_roi, cv2.COLOR_BGR2HSV)
     
     # Green range in HSV (upward arrow)
     green_lower = np.array([35, 50, 50])
@@ -205,12 +227,26 @@ def _load_manifest(path: Path) -> List[Dict[str, Any]]:
         raise FileNotFoundError(f"manifest.json not found at: {path.resolve()}")
     return json.loads(path.read_text(encoding="utf-8"))
 
+def _prefetch_images(paths: List[Path], ahead: int = 2) -> Iterator[Optional[np.ndarray]]:
+    """Yield cv2.imread() of each path in order, decoding the next `ahead`
+    images on a background thread while the caller OCRs the current one.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        remaining = iter(paths)
+        pending = deque(pool.submit(cv2.imread, str(p)) for _, p in zip(range(ahead), remaining))
+        while pending:
+            img = pending.popleft().result()
+            nxt = next(remaining, None)
+            if nxt is not None:
+                pending.append(pool.submit(cv2.imread, str(nxt)))
+            yield img
+
 def _extract_team_name(img_bgr: np.ndarray, filename: str = "") -> str:
     """Extract team name from screenshot using OCR.
     Team name ROI: x=111, y=84, w=268, h=41
     """
     # Team name ROI (user-calibrated coordinates)
-    team_roi = img_bgr[84:125, 111:379].copy()
+    team_roi = img_bgr[84:125, 111:379]
     
     # Preprocess for OCR
     gray = cv2.cvtColor(team_roi, cv2.COLOR_BGR2GRAY)
@@ -232,7 +268,7 @@ def _extract_team_name(img_bgr: np.ndarray, filename: str = "") -> str:
 
 def _crop_roi_bgr(img_bgr: np.ndarray, roi: Tuple[int, int, int, int]) -> np.ndarray:
     x, y, w, h = roi
-    return img_bgr[y:y + h, x:x + w].copy()
+    return img_bgr[y:y + h, x:x + w]
 
 def _save_debug(path: Path, img: np.ndarray) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -325,9 +361,14 @@ def _find_text_lines(binary: np.ndarray) -> List[Tuple[int, int]]:
 
 def _prep_name_for_ocr(line_bgr: np.ndarray) -> np.ndarray:
     gray = cv2.cvtColor(line_bgr, cv2.COLOR_BGR2GRAY)
-    bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-    bw = cv2.resize(bw, None, fx=3.0, fy=3.0, interpolation=cv2.INTER_CUBIC)
-    bw = cv2.copyMakeBorder(bw, 14, 14, 14, 14, cv2.BORDER_CONSTANT, value=255)
+    cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=gray)
+
+    # Resize straight into a white canvas with the border baked in
+    # (same output as resize + copyMakeBorder, one allocation less)
+    pad = 14
+    h, w = gray.shape
+    bw = np.full((h * 3 + 2 * pad, w * 3 + 2 * pad), 255, dtype=np.uint8)
+    cv2.resize(gray, (w * 3, h * 3), dst=bw[pad:-pad, pad:-pad], interpolation=cv2.INTER_CUBIC)
     return bw
 
 def _ocr_try_name_configs(img_bw: np.ndarray) -> List[Tuple[str, float, str]]:
@@ -358,6 +399,9 @@ def _ocr_try_name_configs(img_bw: np.ndarray) -> List[Tuple[str, float, str]]:
     return results
 
 
+_RE_SCORE_FULL = re.compile(r"[A-Za-z]\.\s?[A-Za-z][A-Za-z'\-]{1,}(?:\s+(?:Jr\.|Sr\.|I|II|III|IV|V|VI|VII|VIII|IX|X))?$")
+_RE_SCORE_WORD = re.compile(r"[A-Za-z][A-Za-z'\-]{2,}")
+
 def _score_candidate(text: str, conf: float) -> float:
     if not text:
         return -999.0
@@ -368,10 +412,14 @@ def _score_candidate(text: str, conf: float) -> float:
         return -999.0
 
     score = 0.0
+    # Cheap shape checks first; the regexes only confirm plausible strings
+    looks_initial = len(t) >= 4 and t[1] == "." and t[0].isalpha()
+    looks_word = len(t) >= 3 and t.replace("'", "").replace("-", "").isalpha()
+
     # Prefer "X. Lastname" (+ optional suffix)
-    if re.fullmatch(r"[A-Za-z]\.\s?[A-Za-z][A-Za-z'\-]{1,}(?:\s+(?:Jr\.|Sr\.|I|II|III|IV|V|VI|VII|VIII|IX|X))?$", t):
+    if looks_initial and _RE_SCORE_FULL.fullmatch(t):
         score += 10.0
-    elif re.fullmatch(r"[A-Za-z][A-Za-z'\-]{2,}", t):
+    elif looks_word and _RE_SCORE_WORD.fullmatch(t):
         score += 6.0
     else:
         score += 1.0
@@ -412,7 +460,7 @@ def _has_special_icon(line_bgr: np.ndarray) -> bool:
         return False
     
     # Check leftmost 40 pixels for icons
-    icon_region = line_bgr[:, :40].copy()
+    icon_region = line_bgr[:, :40]
     
     # Convert to HSV for color detection
     hsv = cv2.cvtColor(icon_region, cv2.COLOR_BGR2HSV)
@@ -495,14 +543,15 @@ def _looks_like_player_name(text: str) -> bool:
 
 def _prep_simple_for_ocr(line_bgr: np.ndarray) -> np.ndarray:
     """For POS/AGE/OVR: simple Otsu + (optional) invert."""
-    gray = cv2.cvtColor(line_bgr, cv2.COLOR_BGR2GRAY)
-    bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+    # All steps write into the grayscale buffer in place
+    bw = cv2.cvtColor(line_bgr, cv2.COLOR_BGR2GRAY)
+    cv2.threshold(bw, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=bw)
 
     # Ensure black text on white background
     if bw.mean() < 127:
-        bw = cv2.bitwise_not(bw)
+        cv2.bitwise_not(bw, dst=bw)
 
-    bw = cv2.medianBlur(bw, 3)
+    cv2.medianBlur(bw, 3, dst=bw)
     return bw
 
 
@@ -527,56 +576,63 @@ def _ocr_text_config(line_bgr: np.ndarray, config: str) -> Tuple[str, float]:
     return text, avg_conf
 
 
-def _ocr_int_config(line_bgr: np.ndarray, debug_name: str = "") -> Tuple[Optional[int], float]:
-    # Multiple OCR strategies - try simple approaches first
+def _ocr_panels(panels: List[np.ndarray], config: str) -> List[Tuple[str, float]]:
+    """OCR many images (e.g. every AGE/OVR variant of a screenshot) with a single Tesseract call.
+
+    Each panel is written as its own page and Tesseract reads them through a
+    list file, so every panel is binarized (and polarity-checked) on its own,
+    exactly as a separate call would; words are grouped back by page_num.
+    Returns (text, mean_conf) per panel, conf is -1.0 if nothing read.
+    """
+    with tempfile.TemporaryDirectory(prefix="nba2k_ocr_") as tmp:
+        tmp_dir = Path(tmp)
+        paths = []
+        for i, panel in enumerate(panels):
+            panel_path = tmp_dir / f"panel_{i:02d}.pnm"
+            cv2.imwrite(str(panel_path), panel)
+            paths.append(str(panel_path))
+        list_file = tmp_dir / "list.txt"
+        list_file.write_text("\n".join(paths) + "\n", encoding="utf-8")
+
+        data = pytesseract.image_to_data(str(list_file), config=config, output_type=pytesseract.Output.DICT)
+
+    words: List[List[str]] = [[] for _ in panels]
+    confs: List[List[float]] = [[] for _ in panels]
+    for txt, conf, page in zip(data.get("text", []), data.get("conf", []), data.get("page_num", [])):
+        txt = (txt or "").strip()
+        idx = int(page) - 1
+        if not txt or not 0 <= idx < len(panels):
+            continue
+        words[idx].append(txt)
+        try:
+            c = float(conf)
+            if c >= 0:
+                confs[idx].append(c)
+        except Exception:
+            pass
+
+    return [
+        (" ".join(w), float(np.mean(c)) if c else -1.0)
+        for w, c in zip(words, confs)
+    ]
+
+
+# (name, image, fixed confidence or None to use Tesseract's word confidence)
+IntVariant = Tuple[str, np.ndarray, Optional[float]]
+
+
+def _int_variants(line_bgr: np.ndarray) -> List[IntVariant]:
+    """Build the AGE/OVR preprocessing variants for one cell (OCR'd later in a batch)."""
     gray = cv2.cvtColor(line_bgr, cv2.COLOR_BGR2GRAY)
-    
-    results = []
-    all_attempts = []  # Track all OCR attempts for debugging
-    partial_digits = []  # Track single digits that might be part of a 2-digit number
-    
-    # Strategy 1: Direct OCR on grayscale (enlarged)
+    variants: List[IntVariant] = []
+
+    # Strategy 1-2: Direct OCR on grayscale (enlarged), and inverted
     gray_large = cv2.resize(gray, None, fx=4, fy=4, interpolation=cv2.INTER_CUBIC)
     gray_large = cv2.copyMakeBorder(gray_large, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=0)
-    try:
-        text = pytesseract.image_to_string(gray_large, config=NUM_TESS_CONFIG).strip()
-        all_attempts.append(f"gray: '{text}'")
-        m = re.search(r"\d{1,3}", text)
-        if m:
-            num = int(m.group(0))
-            # For OVR: Accept 10-19 temporarily (will be fixed later to 70-79)
-            if "OVR" in debug_name and 10 <= num <= 99:
-                results.append((num, 60.0))
-            elif "AGE" in debug_name and 18 <= num <= 45:
-                results.append((num, 60.0))
-            elif "AGE" not in debug_name and "OVR" not in debug_name and ((18 <= num <= 45) or (60 <= num <= 99)):
-                results.append((num, 60.0))  # Fallback for unknown type
-            elif len(m.group(0)) == 1:  # Single digit - might be partial
-                partial_digits.append(num)
-    except Exception as e:
-        all_attempts.append(f"gray: ERROR {e}")
-    
-    # Strategy 2: Inverted grayscale
-    gray_inv = cv2.bitwise_not(gray_large)
-    try:
-        text = pytesseract.image_to_string(gray_inv, config=NUM_TESS_CONFIG).strip()
-        all_attempts.append(f"gray_inv: '{text}'")
-        m = re.search(r"\d{1,3}", text)
-        if m:
-            num = int(m.group(0))
-            # For OVR: Accept 10-19 temporarily (will be fixed later to 70-79)
-            if "OVR" in debug_name and 10 <= num <= 99:
-                results.append((num, 60.0))
-            elif "AGE" in debug_name and 18 <= num <= 45:
-                results.append((num, 60.0))
-            elif "AGE" not in debug_name and "OVR" not in debug_name and ((18 <= num <= 45) or (60 <= num <= 99)):
-                results.append((num, 60.0))  # Fallback for unknown type
-            elif len(m.group(0)) == 1:
-                partial_digits.append(num)
-    except Exception as e:
-        all_attempts.append(f"gray_inv: ERROR {e}")
-    
-    # Strategy 3-5: Different thresholding methods
+    variants.append(("gray", gray_large, 60.0))
+    variants.append(("gray_inv", cv2.bitwise_not(gray_large), 60.0))
+    
+    # Strategy 3-8: Different thresholding methods, each also inverted
     for idx, thresh_method in enumerate([(0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU),
                                           (127, 255, cv2.THRESH_BINARY),
                                           (None, None, None)]):  # Adaptive
@@ -591,36 +647,41 @@ def _ocr_int_config(line_bgr: np.ndarray, debug_name: str = "") -> Tuple[Optiona
         bw = cv2.medianBlur(bw, 3)
         bw_large = cv2.resize(bw, None, fx=4, fy=4, interpolation=cv2.INTER_CUBIC)
         bw_large = cv2.copyMakeBorder(bw_large, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=255)
-        
-        for invert_idx, img in enumerate([bw_large, cv2.bitwise_not(bw_large)]):
-            try:
-                text = pytesseract.image_to_string(img, config=NUM_TESS_CONFIG).strip()
-                inv_str = "_inv" if invert_idx == 1 else ""
-                all_attempts.append(f"{method_name}{inv_str}: '{text}'")
-                m = re.search(r"\d{1,3}", text)
-                if m:
-                    num = int(m.group(0))
-                    # For OVR: Accept 10-19 temporarily (will be fixed later to 70-79)
-                    is_valid = False
-                    if "OVR" in debug_name and 10 <= num <= 99:
-                        is_valid = True
-                    elif "AGE" in debug_name and 18 <= num <= 45:
-                        is_valid = True
-                    elif "AGE" not in debug_name and "OVR" not in debug_name and ((18 <= num <= 45) or (60 <= num <= 99)):
-                        is_valid = True  # Fallback for unknown type
-                    
-                    if is_valid:
-                        # Try to get confidence
-                        data = pytesseract.image_to_data(img, config=NUM_TESS_CONFIG,
-                                                         output_type=pytesseract.Output.DICT)
-                        confs = [float(c) for c in data.get("conf", []) if c != -1]
-                        conf = float(np.mean(confs)) if confs else 50.0
-                        results.append((num, conf))
-                    elif len(m.group(0)) == 1:
-                        partial_digits.append(num)
-            except Exception as e:
-                inv_str = "_inv" if invert_idx == 1 else ""
-                all_attempts.append(f"{method_name}{inv_str}: ERROR {e}")
+        variants.append((method_name, bw_large, None))
+        variants.append((f"{method_name}_inv", cv2.bitwise_not(bw_large), None))
+
+    return variants
+
+
+def _pick_int(variants: List[IntVariant], panel_results: List[Tuple[str, float]],
+              debug_name: str = "") -> Tuple[Optional[int], float]:
+    """Choose the AGE/OVR value from one cell's variant OCR results."""
+    results = []
+    all_attempts = []  # Track all OCR attempts for debugging
+    partial_digits = []  # Track single digits that might be part of a 2-digit number
+
+    def _is_valid(num: int) -> bool:
+        # For OVR: Accept 10-19 temporarily (will be fixed later to 70-79)
+        if "OVR" in debug_name:
+            return 10 <= num <= 99
+        if "AGE" in debug_name:
+            return 18 <= num <= 45
+        return (18 <= num <= 45) or (60 <= num <= 99)  # Fallback for unknown type
+
+    for (name, _img, fixed_conf), (text, word_conf) in zip(variants, panel_results):
+        all_attempts.append(f"{name}: '{text}'")
+        m = re.search(r"\d{1,3}", text)
+        if not m:
+            continue
+        num = int(m.group(0))
+        if _is_valid(num):
+            if fixed_conf is not None:
+                conf = fixed_conf
+            else:
+                conf = word_conf if word_conf >= 0 else 50.0
+            results.append((num, conf))
+        elif len(m.group(0)) == 1:  # Single digit - might be partial
+            partial_digits.append(num)
     
     # Domain knowledge: Fix common OCR errors based on valid ranges
     # NBA 2K26 ratings: 60-99 (mostly 70-99), Ages: 18-45 (mostly 20-40)
@@ -641,25 +702,14 @@ def _ocr_int_config(line_bgr: np.ndarray, debug_name: str = "") -> Tuple[Optiona
     if not results and partial_digits:
         # For AGE: common pattern is 2X (20-29), 3X (30-39), also 18-19
         # For OVR: common pattern is 7X (70-79), 8X (80-89), 9X (90-99)
+        if "AGE" in debug_name:
+            fallbacks = _AGE_FALLBACKS
+        elif "OVR" in debug_name:
+            fallbacks = _OVR_FALLBACKS
+        else:
+            fallbacks = {}
         for digit in set(partial_digits):  # Remove duplicates
-            if "AGE" in debug_name:
-                # Special case: single digit 8 or 9 could be 18, 19, 28, 29, 38, 39
-                if digit in [8, 9]:
-                    for age in [10 + digit, 20 + digit, 30 + digit]:
-                        if 18 <= age <= 45:
-                            results.append((age, 35.0))
-                else:
-                    # Try 2X and 3X for other digits
-                    for tens in [2, 3]:
-                        candidate = tens * 10 + digit
-                        if 20 <= candidate <= 39:
-                            results.append((candidate, 40.0))  # Lower confidence
-            elif "OVR" in debug_name:
-                # Try 7X, 8X, 9X for ratings (NBA players rarely below 70)
-                for tens in [7, 8, 9]:
-                    candidate = tens * 10 + digit
-                    if 70 <= candidate <= 99:
-                        results.append((candidate, 40.0))  # Lower confidence
+            results.extend(fallbacks.get(digit, ()))
     
     # If we got no valid results, optionally log in debug mode
     # (removed verbose logging)
@@ -717,6 +767,7 @@ def main() -> None:
     print(f"\nProcessing {total_screenshots} roster screenshot(s)...")
     print("=" * 60)
     
+    jobs: List[Tuple[str, Path]] = []
     for entry in roster_entries:
         fname = entry.get("file")
         if not fname:
@@ -726,8 +777,10 @@ def main() -> None:
         if not img_path.exists():
             print(f"WARNING: missing screenshot in input_screenshots: {fname}")
             continue
+        jobs.append((fname, img_path))
 
-        img_bgr = cv2.imread(str(img_path))
+    # Decode the next screenshots in the background while OCR runs on this one
+    for (fname, img_path), img_bgr in zip(jobs, _prefetch_images([p for _, p in jobs])):
         if img_bgr is None:
             print(f"WARNING: could not read image: {fname}")
             continue
@@ -741,12 +794,14 @@ def main() -> None:
         agecol = _crop_roi_bgr(img_bgr, AGE_COL_ROI)
         ratingcol = _crop_roi_bgr(img_bgr, RATING_COL_ROI)
         incol = _crop_roi_bgr(img_bgr, IN_COL_ROI)
+        # Convert the whole IN column once; each line slices its rows from it
+        incol_hsv = cv2.cvtColor(incol, cv2.COLOR_BGR2HSV)
 
         # Trim left/right slightly to avoid icons
         h, w, _ = namecol.shape
         lx = int(w * LEFT_TRIM_RATIO)
         rx = int(w * (1.0 - RIGHT_TRIM_RATIO))
-        namecol_trim = namecol[:, lx:rx].copy()
+        namecol_trim = namecol[:, lx:rx]
         
         if args.debug:
             _save_debug(DEBUG_DIR / f"{Path(fname).stem}__namecol.png", namecol_trim)
@@ -757,8 +812,12 @@ def main() -> None:
         if args.debug:
             _save_debug(DEBUG_DIR / f"{Path(fname).stem}__mask.png", mask)
 
+        # Rows wait here until every AGE/OVR variant of the screenshot is read
+        # in one Tesseract call: (key, text, conf, player, age variants, ovr variants)
+        pending: List[Tuple[str, str, float, Dict[str, Any], List[IntVariant], List[IntVariant]]] = []
+
         for i, (y0, y1) in enumerate(bands):
-            line_bgr = namecol_trim[y0:y1, :].copy()
+            line_bgr = namecol_trim[y0:y1, :]
 
             if line_bgr.shape[0] < 14 or line_bgr.shape[1] < 60:
                 continue
@@ -789,10 +848,10 @@ def main() -> None:
             if key not in unique_names or conf > unique_names[key]["conf"]:
                 unique_names[key] = {"name": text, "conf": conf, "best_from": fname}
 
-            pos_line = poscol[y0:y1, :].copy()
-            age_line = agecol[y0:y1, :].copy()
-            ovr_line = ratingcol[y0:y1, :].copy()
-            in_line  = incol[y0:y1, :].copy()
+            pos_line = poscol[y0:y1, :]
+            age_line = agecol[y0:y1, :]
+            ovr_line = ratingcol[y0:y1, :]
+            in_line  = incol[y0:y1, :]
 
             if args.debug:
                 _save_debug(DEBUG_DIR / f"{Path(fname).stem}__line_{i:02d}_age.png", age_line)
@@ -804,17 +863,14 @@ def main() -> None:
             valid_pos = {"PG", "SG", "SF", "PF", "C"}
             pos = next((p for p in valid_pos if p in pos_txt), None)        
             
-            age_val, _age_conf = _ocr_int_config(age_line, f"{text} AGE")
-            ovr_val, _ovr_conf = _ocr_int_config(ovr_line, f"{text} OVR")
-
-            in_delta = _parse_in_delta(in_line)  # +1 / -2 / None
+            in_delta = _parse_in_delta(in_line, incol_hsv[y0:y1, :])  # +1 / -2 / None
 
             player = {
                 "name": text,
                 "team": team_name,
                 "pos": pos,
-                "age": age_val,
-                "ovr": ovr_val,
+                "age": None,
+                "ovr": None,
                 "in_delta": in_delta,
                 "in_str": (f"{in_delta:+d}" if in_delta is not None else None),  # "+1" / "-2" / None
                 "source": fname,
@@ -822,6 +878,24 @@ def main() -> None:
                 "y1": y1,
                 "name_conf": round(conf, 2),
             }
+            pending.append((key, text, conf, player, _int_variants(age_line), _int_variants(ovr_line)))
+
+        panels = [img for *_, age_vs, ovr_vs in pending for _, img, _ in age_vs + ovr_vs]
+        try:
+            panel_results = _ocr_panels(panels, NUM_TESS_CONFIG) if panels else []
+        except Exception as e:
+            print(f" (AGE/OVR OCR failed: {e})", end="")
+            panel_results = [("", -1.0)] * len(panels)
+
+        offset = 0
+        for key, text, conf, player, age_vs, ovr_vs in pending:
+            age_res = panel_results[offset:offset + len(age_vs)]
+            offset += len(age_vs)
+            ovr_res = panel_results[offset:offset + len(ovr_vs)]
+            offset += len(ovr_vs)
+            player["age"], _age_conf = _pick_int(age_vs, age_res, f"{text} AGE")
+            player["ovr"], _ovr_conf = _pick_int(ovr_vs, ovr_res, f"{text} OVR")
+            y0, y1 = player["y0"], player["y1"]
 
             existing = unique_players.get(key)
             
@@ -4,18 +4,39 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+import queue
 import re
+import shlex
 import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Dict, Any, Optional
 
+# Parallelism comes from one worker process per core (see main()); Tesseract's
+# own OpenMP threads only contend with them. Set before tesserocr is loaded and
+# inherited by spawned tesseract processes. An explicit setting is kept.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import numpy as np
 import cv2
 import pytesseract
 from pytesseract import TesseractNotFoundError
 
+# Optional: tesserocr keeps one Tesseract instance loaded in-process instead of
+# spawning the tesseract binary (and reloading the model) for every OCR call.
+try:
+    from PIL import Image
+    from tesserocr import PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
 # =========================
 # USER CONFIG
 # =========================
@@ -27,6 +48,11 @@ STANDINGS_RANK_COL_ROI: Tuple[int, int, int, int] = (77, 443, 75, 469)
 STANDINGS_TEAM_COL_ROI: Tuple[int, int, int, int] = (221, 443, 291, 469)
 STANDINGS_WL_COL_ROI: Tuple[int, int, int, int] = (506, 443, 108, 469)
 
+# Bands with fewer ink pixels than this (at native resolution) skip OCR.
+# Digit columns get a lower floor so a lone narrow "1" still reaches Tesseract.
+MIN_TEAM_INK_PIXELS = 50
+MIN_DIGIT_INK_PIXELS = 15
+
 # Paths
 PROJECT_ROOT = Path(".")
 INPUT_DIR = PROJECT_ROOT / "input_screenshots"
@@ -88,13 +114,45 @@ def _archive_processed_screenshots(processed_files: List[str], screenshot_type:
     
     return archived_count
 
+def _ink_pixels(bw: np.ndarray) -> int:
+    """Foreground pixel count of a binary image, whichever polarity it has."""
+    n = cv2.countNonZero(bw)
+    return min(n, bw.size - n)
+
 def _crop_roi_bgr(img_bgr: np.ndarray, roi: Tuple[int, int, int, int]) -> np.ndarray:
     x, y, w, h = roi
-    return img_bgr[y:y + h, x:x + w].copy()
+    return img_bgr[y:y + h, x:x + w]
+
+_DEBUG_QUEUE: Optional[queue.Queue] = None
+
+def _debug_writer(q: queue.Queue) -> None:
+    made_dirs = set()
+    while True:
+        path, img = q.get()
+        try:
+            if path.parent not in made_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(path.parent)
+            # Fastest zlib level; debug images are for eyeballing, not archiving
+            cv2.imwrite(str(path), img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        finally:
+            q.task_done()
 
 def _save_debug(path: Path, img: np.ndarray) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(path), img)
+    """Queue a debug image; PNG encoding runs on a background writer thread."""
+    global _DEBUG_QUEUE
+    if _DEBUG_QUEUE is None:
+        _DEBUG_QUEUE = queue.Queue()
+        threading.Thread(target=_debug_writer, args=(_DEBUG_QUEUE,), daemon=True).start()
+    _DEBUG_QUEUE.put((path, img.copy()))
+
+def _flush_debug() -> None:
+    """Block until every queued debug image has been written."""
+    if _DEBUG_QUEUE is not None:
+        _DEBUG_QUEUE.join()
+
+# Line-detection dilation kernel, shared by every call
+_DILATE_K = np.ones((2, 2), np.uint8)
 
 def _preprocess_for_line_detection(col_bgr: np.ndarray) -> np.ndarray:
     gray = cv2.cvtColor(col_bgr, cv2.COLOR_BGR2GRAY)
@@ -105,64 +163,193 @@ def _preprocess_for_line_detection(col_bgr: np.ndarray) -> np.ndarray:
         31, 12
     )
     bw = cv2.medianBlur(bw, 3)
-    bw = cv2.dilate(bw, np.ones((2, 2), np.uint8), iterations=1)
+    bw = cv2.dilate(bw, _DILATE_K, iterations=1)
     return bw
 
 def _find_text_lines(binary: np.ndarray) -> List[Tuple[int, int]]:
     h, w = binary.shape
-    row_sum = binary.sum(axis=1) / (255.0 * w)
-    smooth = np.convolve(row_sum, np.ones(9) / 9, mode="same")
+    # Integer row sums in OpenCV's vectorized reduce (exact, so same as .sum(axis=1))
+    row_sum = cv2.reduce(binary, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() / (255.0 * w)
+    # 9-row moving average (same as np.convolve(..., mode="same")) via cumsum
+    cs = np.cumsum(np.pad(row_sum, (5, 4)))
+    smooth = (cs[9:] - cs[:-9]) / 9
 
     thr = max(0.02, float(np.percentile(smooth, 85)) * 0.25)
     in_text = smooth > thr
 
-    lines: List[Tuple[int, int]] = []
-    y = 0
-    while y < h:
-        if not in_text[y]:
-            y += 1
-            continue
-        y0 = y
-        while y < h and in_text[y]:
-            y += 1
-        y1 = y
-        if (y1 - y0) >= 10:
-            pad = 4
-            lines.append((max(0, y0 - pad), min(h, y1 + pad)))
-    return lines
+    # Rising/falling edges of the in-text mask give each band's [y0, y1)
+    edges = np.diff(np.concatenate(([0], in_text.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= 10
 
-def _parse_standings_screen(img_bgr: np.ndarray, fname: str, args) -> List[Dict[str, Any]]:
-    """Parse a standings screen to extract conference, rank, team name, and W-L record."""
+    pad = 4
+    return [(max(0, int(y0) - pad), min(h, int(y1) + pad))
+            for y0, y1 in zip(starts[keep], ends[keep])]
+
+# One persistent tesserocr API per distinct config string (per process)
+_TESS_APIS: Dict[str, Any] = {}
+
+def _tess_api(config: str):
+    """Return this process's tesserocr API for `config`, or None if unavailable.
+
+    Each config gets its own API with PSM, engine and variables applied at
+    Init, so init-only settings (--oem, dictionary loading) take effect and
+    one column's whitelist can't leak into another's calls.
+    """
+    if PyTessBaseAPI is None:
+        return None
+    api = _TESS_APIS.get(config)
+    if api is None:
+        psm, oem, variables = _parse_tess_config(config)
+        kwargs: Dict[str, Any] = {"variables": variables}
+        if psm is not None:
+            kwargs["psm"] = psm
+        if oem is not None:
+            kwargs["oem"] = oem
+        api = _TESS_APIS[config] = PyTessBaseAPI(**kwargs)
+    return api
+
+def _parse_tess_config(config: str) -> Tuple[Optional[int], Optional[int], Dict[str, str]]:
+    """Split a pytesseract-style config string into (psm, oem, {variable: value})."""
+    psm = None
+    oem = None
+    variables: Dict[str, str] = {}
+    tokens = shlex.split(config)
+    for i, tok in enumerate(tokens[:-1]):
+        if tok == "--psm":
+            psm = int(tokens[i + 1])
+        elif tok == "--oem":
+            oem = int(tokens[i + 1])
+        elif tok == "-c" and "=" in tokens[i + 1]:
+            key, value = tokens[i + 1].split("=", 1)
+            variables[key] = value
+    return psm, oem, variables
+
+def _ocr_api(api, images: List[np.ndarray]) -> List[str]:
+    """OCR images with an already-configured tesserocr API."""
+    texts = []
+    for img in images:
+        if img.ndim == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        api.SetImage(Image.fromarray(img))
+        texts.append(api.GetUTF8Text().strip())
+    return texts
+
+def _ocr_one(img: np.ndarray, config: str) -> str:
+    """OCR a single image, in-process when tesserocr is available."""
+    api = _tess_api(config)
+    if api is not None:
+        return _ocr_api(api, [img])[0]
+    return pytesseract.image_to_string(img, config=config).strip()
+
+def _ocr_batch(images: List[Optional[np.ndarray]], config: str) -> List[str]:
+    """OCR a list of images with a single Tesseract process.
+
+    With tesserocr installed the images go through the persistent in-process
+    API. Otherwise each image is written to a temp dir, Tesseract reads them
+    all through a list file and emits TSV; words are grouped back per image
+    by page_num. Returns one stripped string per input image (in order);
+    None entries are skipped and come back as "".
+    """
+    if not images:
+        return []
     
-    standings_teams = []
+    todo = [i for i, img in enumerate(images) if img is not None]
+    if len(todo) < len(images):
+        texts = [""] * len(images)
+        for i, text in zip(todo, _ocr_batch([images[i] for i in todo], config)):
+            texts[i] = text
+        return texts
+    
+    api = _tess_api(config)
+    if api is not None:
+        return _ocr_api(api, images)
+    
+    with tempfile.TemporaryDirectory(prefix="nba2k_ocr_") as tmp:
+        tmp_dir = Path(tmp)
+        paths = []
+        # Uncompressed PNM: the files are read once and deleted, so deflating
+        # them (and inflating again in Leptonica) is wasted work
+        for i, img in enumerate(images):
+            img_path = tmp_dir / f"ocr_{i:03d}.pnm"
+            cv2.imwrite(str(img_path), img)
+            paths.append(str(img_path))
+        list_file = tmp_dir / "list.txt"
+        list_file.write_text("\n".join(paths) + "\n", encoding="utf-8")
+        
+        cmd = [pytesseract.pytesseract.tesseract_cmd, str(list_file), "stdout", *shlex.split(config), "tsv"]
+        proc = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8")
+        if proc.returncode != 0:
+            raise RuntimeError(f"tesseract failed: {proc.stderr.strip()}")
+    
+    # TSV columns: level page_num block_num par_num line_num word_num left top width height conf text
+    words: List[List[str]] = [[] for _ in images]
+    for row in proc.stdout.splitlines():
+        cols = row.split("\t")
+        if len(cols) < 12 or cols[0] != "5":
+            continue
+        page = int(cols[1]) - 1
+        if 0 <= page < len(images) and cols[11].strip():
+            words[page].append(cols[11].strip())
     
-    # Detect conference - try OCR first
-    conference_roi = img_bgr[285:310, 450:570].copy()
+    return [" ".join(w) for w in words]
+
+# Patterns used per row, compiled once at import
+_RANK_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?')
+_WL_RE = re.compile(r'(\d{1,2})\s*-\s*(\d{1,2})')
+_NAME_STRIP_RE = re.compile(r'^[^A-Za-z]+')
+_NAME_CLEAN_RE = re.compile(r'[^A-Za-z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Rank and W-L cells are sent binarized, dark on light, and hold only digits:
+# LSTM engine only, no inverted-line retry and none of the dictionaries
+_DIGIT_OCR_FLAGS = ("--oem 1 -c tessedit_do_invert=0 -c load_system_dawg=0 -c load_freq_dawg=0 "
+                    "-c load_punc_dawg=0 -c load_number_dawg=0")
+
+# Team-based conference lookup (fallback)
+_WESTERN_TEAMS = frozenset({
+    "dallas mavericks", "los angeles lakers", "oklahoma city thunder", 
+    "portland trail blazers", "new orleans pelicans", "san antonio spurs",
+    "utah jazz", "sacramento kings", "minnesota timberwolves", 
+    "los angeles clippers", "memphis grizzlies", "phoenix suns",
+    "golden state warriors", "houston rockets", "denver nuggets"
+})
+_EASTERN_TEAMS = frozenset({
+    "atlanta hawks", "boston celtics", "brooklyn nets", "charlotte hornets",
+    "chicago bulls", "cleveland cavaliers", "detroit pistons", "indiana pacers",
+    "miami heat", "milwaukee bucks", "new york knicks", "orlando magic",
+    "philadelphia 76ers", "toronto raptors", "washington wizards"
+})
+
+def _ocr_conference(img_bgr: np.ndarray, fname: str, args) -> Optional[str]:
+    """Read the conference header; returns "Western", "Eastern" or None."""
+    conference_roi = img_bgr[285:310, 450:570]
     conference_roi = cv2.resize(conference_roi, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC)
     conference_gray = cv2.cvtColor(conference_roi, cv2.COLOR_BGR2GRAY)
     _, conference_bw = cv2.threshold(conference_gray, 127, 255, cv2.THRESH_BINARY)
     if conference_bw.mean() < 127:
         conference_bw = cv2.bitwise_not(conference_bw)
-    conference_text = pytesseract.image_to_string(conference_bw, config="--psm 7").strip().upper()
+    conference_text = _ocr_one(conference_bw, "--psm 7").upper()
     
     if args.debug:
         _save_debug(DEBUG_DIR / f"{Path(fname).stem}__conference_roi.png", conference_bw)
     
-    screenshot_conference = "Western" if "WEST" in conference_text else "Eastern" if "EAST" in conference_text else None
+    return "Western" if "WEST" in conference_text else "Eastern" if "EAST" in conference_text else None
+
+def _otsu(gray: np.ndarray) -> np.ndarray:
+    """Otsu-binarize one grayscale band."""
+    return cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+
+def _parse_standings_screen(img_bgr: np.ndarray, fname: str, args) -> List[Dict[str, Any]]:
+    """Parse a standings screen to extract conference, rank, team name, and W-L record."""
     
-    # Team-based conference lookup (fallback)
-    western_teams_set = {
-        "dallas mavericks", "los angeles lakers", "oklahoma city thunder", 
-        "portland trail blazers", "new orleans pelicans", "san antonio spurs",
-        "utah jazz", "sacramento kings", "minnesota timberwolves", 
-        "los angeles clippers", "memphis grizzlies", "phoenix suns",
-        "golden state warriors", "houston rockets", "denver nuggets"
-    }
+    standings_teams = []
     
     # Try to extract power rank from the team detail card
-    power_rank_roi = img_bgr[240:260, 550:650].copy()
-    power_rank_text = pytesseract.image_to_string(power_rank_roi, config="--psm 7 -c tessedit_char_whitelist=0123456789thsrdnTPowerRak:").strip()
-    power_rank_match = re.search(r'(\d{1,2})(?:st|nd|rd|th)?', power_rank_text)
+    power_rank_roi = img_bgr[240:260, 550:650]
+    power_rank_text = _ocr_one(power_rank_roi, "--psm 7 -c tessedit_char_whitelist=0123456789thsrdnTPowerRak:")
+    power_rank_match = _RANK_RE.search(power_rank_text)
     power_rank = int(power_rank_match.group(1)) if power_rank_match and 1 <= int(power_rank_match.group(1)) <= 30 else None
     
     # Crop the columns
@@ -177,58 +364,91 @@ def _parse_standings_screen(img_bgr: np.ndarray, fname: str, args) -> List[Dict[
     
     # Detect text lines in team name column
     mask = _preprocess_for_line_detection(teamcol)
-    bands = _find_text_lines(mask)
+    bands = [(y0, y1) for y0, y1 in _find_text_lines(mask) if y1 - y0 >= 10]
     
-    for i, (y0, y1) in enumerate(bands):
-        if y1 - y0 < 10:
+    # Preprocess every band first, then OCR each column in one Tesseract run
+    team_imgs: List[np.ndarray] = []
+    rank_imgs: List[Optional[np.ndarray]] = []
+    wl_imgs: List[Optional[np.ndarray]] = []
+    
+    # Grayscale once per column, but Otsu per band: the selected row and the
+    # alternating row shading have different backgrounds, so one column-wide
+    # threshold would drop or invert text on those rows
+    team_gray = cv2.cvtColor(teamcol, cv2.COLOR_BGR2GRAY)
+    rank_gray = cv2.cvtColor(rankcol, cv2.COLOR_BGR2GRAY)
+    wl_gray = cv2.cvtColor(wlcol, cv2.COLOR_BGR2GRAY)
+    
+    # Binarized bands are upscaled with nearest-neighbour: block replication keeps
+    # edges sharp instead of reintroducing grey ramps Tesseract must re-threshold
+    for y0, y1 in bands:
+        # Team name - an empty name drops the row anyway, so skip the whole band
+        team_bw = _otsu(team_gray[y0:y1, :])
+        if _ink_pixels(team_bw) < MIN_TEAM_INK_PIXELS:
             continue
+        team_bw = cv2.resize(team_bw, None, fx=3.0, fy=3.0, interpolation=cv2.INTER_NEAREST)
+        team_imgs.append(team_bw)
         
-        # Extract team name
-        team_line = teamcol[y0:y1, :].copy()
-        team_gray = cv2.cvtColor(team_line, cv2.COLOR_BGR2GRAY)
-        team_bw = cv2.threshold(team_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-        team_bw = cv2.resize(team_bw, None, fx=3.0, fy=3.0, interpolation=cv2.INTER_CUBIC)
-        team_name = pytesseract.image_to_string(team_bw, config="--psm 7").strip()
+        # Rank (None = blank cell, not sent to Tesseract)
+        rank_bw = _otsu(rank_gray[y0:y1, :])
+        if _ink_pixels(rank_bw) < MIN_DIGIT_INK_PIXELS:
+            rank_imgs.append(None)
+        else:
+            if rank_bw.mean() < 127:
+                rank_bw = cv2.bitwise_not(rank_bw)
+            rank_bw = cv2.resize(rank_bw, None, fx=4.0, fy=4.0, interpolation=cv2.INTER_NEAREST)
+            rank_bw = cv2.copyMakeBorder(rank_bw, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=255)
+            rank_imgs.append(rank_bw)
         
+        # W-L record
+        wl_bw = _otsu(wl_gray[y0:y1, :])
+        if _ink_pixels(wl_bw) < MIN_DIGIT_INK_PIXELS:
+            wl_imgs.append(None)
+        else:
+            if wl_bw.mean() < 127:
+                wl_bw = cv2.bitwise_not(wl_bw)
+            wl_bw = cv2.resize(wl_bw, None, fx=4.0, fy=4.0, interpolation=cv2.INTER_NEAREST)
+            wl_bw = cv2.copyMakeBorder(wl_bw, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=255)
+            wl_imgs.append(wl_bw)
+    
+    team_texts = _ocr_batch(team_imgs, "--psm 7")
+    rank_texts = _ocr_batch(rank_imgs, f"--psm 7 -c tessedit_char_whitelist=0123456789 {_DIGIT_OCR_FLAGS}")
+    wl_texts = _ocr_batch(wl_imgs, f"--psm 7 -c tessedit_char_whitelist=0123456789- {_DIGIT_OCR_FLAGS}")
+    
+    rows = []
+    for team_name, rank_text, wl_text in zip(team_texts, rank_texts, wl_texts):
         # Clean up team name
-        team_name = re.sub(r'^[^A-Za-z]+', '', team_name)
-        team_name = re.sub(r'[^A-Za-z0-9\s]', ' ', team_name)
-        team_name = re.sub(r'\s+', ' ', team_name).strip()
+        team_name = _NAME_STRIP_RE.sub('', team_name)
+        team_name = _NAME_CLEAN_RE.sub(' ', team_name)
+        team_name = _WS_RE.sub(' ', team_name).strip()
         
         if not team_name or team_name.upper() in ["TEAM", "NAME"]:
             continue
         
-        # Extract rank
-        rank_line = rankcol[y0:y1, :].copy()
-        rank_gray = cv2.cvtColor(rank_line, cv2.COLOR_BGR2GRAY)
-        rank_bw = cv2.threshold(rank_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-        if rank_bw.mean() < 127:
-            rank_bw = cv2.bitwise_not(rank_bw)
-        rank_bw = cv2.resize(rank_bw, None, fx=4.0, fy=4.0, interpolation=cv2.INTER_CUBIC)
-        rank_bw = cv2.copyMakeBorder(rank_bw, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=255)
-        rank_text = pytesseract.image_to_string(rank_bw, config="--psm 7 -c tessedit_char_whitelist=0123456789").strip()
         rank_val = int(rank_text) if rank_text.isdigit() and 1 <= int(rank_text) <= 30 else None
         
-        # Extract W-L record
-        wl_line = wlcol[y0:y1, :].copy()
-        wl_gray = cv2.cvtColor(wl_line, cv2.COLOR_BGR2GRAY)
-        wl_bw = cv2.threshold(wl_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-        if wl_bw.mean() < 127:
-            wl_bw = cv2.bitwise_not(wl_bw)
-        wl_bw = cv2.resize(wl_bw, None, fx=4.0, fy=4.0, interpolation=cv2.INTER_CUBIC)
-        wl_bw = cv2.copyMakeBorder(wl_bw, 15, 15, 15, 15, cv2.BORDER_CONSTANT, value=255)
-        wl_text = pytesseract.image_to_string(wl_bw, config="--psm 7 -c tessedit_char_whitelist=0123456789-").strip()
-        
         # Clean W-L format
-        wl_match = re.search(r'(\d{1,2})\s*-\s*(\d{1,2})', wl_text)
+        wl_match = _WL_RE.search(wl_text)
         if wl_match:
             wl_text = f"{wl_match.group(1)}-{wl_match.group(2)}"
         elif not wl_text or wl_text == "-":
             wl_text = None
         
+        rows.append((team_name, team_name.lower(), rank_val, wl_text))
+    
+    # If every cleanly read team name is from the same conference, that settles
+    # it; otherwise (nothing matched, or a league/division view mixing both)
+    # fall back to the conference header and the per-row lookup below
+    matched = {"Western" if team_check in _WESTERN_TEAMS else "Eastern"
+               for _, team_check, _, _ in rows
+               if team_check in _WESTERN_TEAMS or team_check in _EASTERN_TEAMS}
+    if len(matched) == 1:
+        screenshot_conference = matched.pop()
+    else:
+        screenshot_conference = _ocr_conference(img_bgr, fname, args)
+    
+    for team_name, team_check, rank_val, wl_text in rows:
         # Determine conference
-        team_check = team_name.lower()
-        if team_check in western_teams_set:
+        if team_check in _WESTERN_TEAMS:
             conference = "Western"
         else:
             conference = "Eastern"
@@ -243,11 +463,52 @@ def _parse_standings_screen(img_bgr: np.ndarray, fname: str, args) -> List[Dict[
                 "power_rank": power_rank,
                 "team": team_name,
                 "record": wl_text if wl_text else None,
-                "source": fname
+                "source": fname,
+                "_key": team_check  # lowered name for main()'s merge; popped there
             })
     
     return standings_teams
 
+def _decode(data: np.ndarray, flags: int = cv2.IMREAD_COLOR) -> Optional[np.ndarray]:
+    """Decode an encoded image buffer; None if it is empty or unreadable."""
+    if data.size == 0:
+        return None
+    return cv2.imdecode(data, flags)
+
+def _table_hash(data: np.ndarray) -> Optional[bytes]:
+    """Exact hash of the rank..W-L table region, used to spot repeated captures.
+    
+    Every pixel counts, so a single changed rank or W-L digit (or a screen
+    scrolled by one row) hashes differently.
+    Returns None if the image could not be read.
+    """
+    gray = _decode(data, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None
+    x0, y, _, h = STANDINGS_RANK_COL_ROI
+    wx, _, ww, _ = STANDINGS_WL_COL_ROI
+    table = np.ascontiguousarray(gray[y:y + h, x0:wx + ww])
+    return hashlib.blake2b(table.data, digest_size=16).digest()
+
+def _init_worker() -> None:
+    """Pool initializer: workers may be spawned without main()'s setup."""
+    if TESSERACT_CMD:
+        pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD
+    # Parallelism is one process per core; keep OpenCV's own thread pool
+    # from oversubscribing the CPU alongside the other workers.
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(1)
+
+def _parse_one(fname: str, data: np.ndarray, args) -> Optional[List[Dict[str, Any]]]:
+    """Decode and parse one screenshot's file bytes (runs in a worker process).
+    Returns None if the image could not be read."""
+    img_bgr = _decode(data)
+    if img_bgr is None:
+        return None
+    standings = _parse_standings_screen(img_bgr, fname, args)
+    _flush_debug()
+    return standings
+
 # =========================
 # Main
 # =========================
@@ -274,57 +535,95 @@ def main() -> None:
     unique_standings: Dict[str, Dict[str, Any]] = {}
     processed = 0
 
-    total_screenshots = len(standings_entries)
-    print(f"\nProcessing {total_screenshots} standings screenshot(s)...")
+    print(f"\nProcessing {len(standings_entries)} standings screenshot(s)...")
     print("=" * 60)
 
+    # One directory scan instead of a stat() per manifest entry
+    available = set()
+    if INPUT_DIR.is_dir():
+        with os.scandir(INPUT_DIR) as it:
+            available = {e.name for e in it if e.is_file()}
+    
+    # Each file is read from disk once; the bytes serve both the duplicate
+    # hash here and the full decode in the worker
+    jobs: List[Tuple[str, np.ndarray]] = []
+    seen_hashes = set()
+    duplicates = 0
     for entry in standings_entries:
         fname = entry.get("file")
         if not fname:
             continue
         
         img_path = INPUT_DIR / fname
-        if not img_path.exists():
+        if fname not in available:
             print(f"WARNING: missing screenshot in input_screenshots: {fname}")
             continue
         
-        img_bgr = cv2.imread(str(img_path))
-        if img_bgr is None:
-            print(f"WARNING: could not read image: {fname}")
-            continue
+        data = np.fromfile(str(img_path), dtype=np.uint8)
         
-        print(f"[{processed + 1}/{total_screenshots}] Processing {fname}...", end="", flush=True)
-        standings_data = _parse_standings_screen(img_bgr, fname, args)
+        # Identical table region = same capture taken twice; OCR it only once
+        table_hash = _table_hash(data)
+        if table_hash is not None:
+            if table_hash in seen_hashes:
+                print(f"Skipping duplicate screenshot: {fname}")
+                duplicates += 1
+                continue
+            seen_hashes.add(table_hash)
+        jobs.append((fname, data))
+    
+    if duplicates:
+        print(f"Skipped {duplicates} duplicate screenshot(s)")
+    
+    # Progress counts only what is actually OCR'd (no missing files or duplicates)
+    total_screenshots = len(jobs)
+    
+    # Screenshots are independent until the merge, so OCR them in parallel,
+    # one single-threaded Tesseract per core (OMP_THREAD_LIMIT above)
+    workers = max(1, min(os.cpu_count() or 1, len(jobs)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = pool.map(
+            _parse_one,
+            [fname for fname, _ in jobs],
+            [data for _, data in jobs],
+            [args] * len(jobs),
+        )
         
-        # Merge duplicates from overlapping screenshots
-        for team in standings_data:
-            key = team["team"].lower()
-            existing = unique_standings.get(key)
+        for (fname, _), standings_data in zip(jobs, results):
+            if standings_data is None:
+                print(f"WARNING: could not read image: {fname}")
+                continue
+            
+            print(f"[{processed + 1}/{total_screenshots}] Processing {fname}...", end="", flush=True)
             
-            if existing is None:
-                unique_standings[key] = team
-            else:
-                merged = existing.copy()
+            # Merge duplicates from overlapping screenshots
+            for team in standings_data:
+                key = team.pop("_key")
+                existing = unique_standings.get(key)
+            
+                if existing is None:
+                    unique_standings[key] = team
+                else:
+                    merged = existing.copy()
                 
-                if team.get("rank") is not None and existing.get("rank") is None:
-                    merged["rank"] = team["rank"]
+                    if team.get("rank") is not None and existing.get("rank") is None:
+                        merged["rank"] = team["rank"]
                 
-                if team.get("power_rank") is not None and existing.get("power_rank") is None:
-                    merged["power_rank"] = team["power_rank"]
+                    if team.get("power_rank") is not None and existing.get("power_rank") is None:
+                        merged["power_rank"] = team["power_rank"]
                 
-                if team.get("record") is not None and existing.get("record") is None:
-                    merged["record"] = team["record"]
+                    if team.get("record") is not None and existing.get("record") is None:
+                        merged["record"] = team["record"]
                 
-                new_complete = int(team.get("rank") is not None) + int(team.get("record") is not None)
-                old_complete = int(existing.get("rank") is not None) + int(existing.get("record") is not None)
-                if new_complete > old_complete:
-                    merged["source"] = fname
+                    new_complete = int(team.get("rank") is not None) + int(team.get("record") is not None)
+                    old_complete = int(existing.get("rank") is not None) + int(existing.get("record") is not None)
+                    if new_complete > old_complete:
+                        merged["source"] = fname
                 
-                unique_standings[key] = merged
-        
-        processed += 1
-        teams_in_screenshot = len([t for t in standings_data if t.get("source") == fname])
-        print(f" ✓ Found {teams_in_screenshot} teams")
+                    unique_standings[key] = merged
+            
+            processed += 1
+            teams_in_screenshot = len([t for t in standings_data if t.get("source") == fname])
+            print(f" ✓ Found {teams_in_screenshot} teams")
     
     # Convert to list and group by conference
     all_standings_list = list(unique_standings.values())
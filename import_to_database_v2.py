@@ -3,11 +3,41 @@
 Import NBA 2K26 data from JSON files into PostgreSQL database (v2 with UUIDs)
 """
 
+import io
 import json
 from pathlib import Path
 import db_config
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
+from psycopg2.extras import execute_values
+
+# Optional: orjson parses the extractor output several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rows per multi-VALUES INSERT (standings upsert); 30 teams always fit in one page
+INSERT_PAGE_SIZE = 1000
+
+# Strips everything but digits and the decimal point from salary strings.
+# The translate table handles Latin-1 in one C pass; the regex only runs if
+# anything outside it survives
+_SALARY_TRANS = str.maketrans('', '', ''.join(
+    chr(i) for i in range(256) if chr(i) not in '0123456789.'
+))
+_SALARY_RE = re.compile(r'[^\d.]')
+
+# Round strings as written by extract_draft_picks.py / edit_draft_picks.py
+_ROUND_MAP = {'1st': 1, '2nd': 2, '1': 1, '2': 2}
+
+# W-L record; like the old split('-'), anything after a second '-' is ignored
+_RECORD_RE = re.compile(r'\s*(\d+)\s*-\s*(\d+)\s*(?:-.*)?', re.DOTALL)
+
+# Draft year as written by the extractor/editor ("2027"); checked up front
+# instead of raising and catching ValueError for every noisy OCR row
+_YEAR_RE = re.compile(r'\s*[+-]?\d+\s*')
 
 # OCR error corrections mapping
 OCR_CORRECTIONS = {
@@ -75,77 +105,122 @@ OCR_CORRECTIONS = {
     'f cates': 'Cavaliers',
     'j haws': 'Hawks',
 }
+# Lookups use the lower-cased, single-spaced name. The keys above already are;
+# normalizing them once here guards future hand-edits that aren't
+OCR_CORRECTIONS = {' '.join(k.lower().split()): v for k, v in OCR_CORRECTIONS.items()}
+
+def load_json(json_file):
+    """Load an extractor JSON file, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(json_file.read_bytes())
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-def similarity_ratio(a, b):
-    """Calculate similarity ratio between two strings (0 to 1)"""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+def build_team_index(cur):
+    """Load the teams table once so team lookups never go back to the database"""
+    cur.execute("SELECT team_id, team_name, abbreviation FROM teams ORDER BY team_id")
+    teams = cur.fetchall()
+    
+    # Case/spacing-insensitive keys: full name, full name without spaces, nickname
+    by_slug = {}
+    by_nickname = {}
+    for team_id, name, _ in reversed(teams):  # reversed: lowest team_id wins a clash
+        by_nickname[name.split()[-1]] = team_id
+        slug = name.lower()
+        by_slug[slug] = team_id
+        by_slug[slug.replace(' ', '')] = team_id
+        by_slug[slug.split()[-1]] = team_id
+    
+    return {
+        'by_name': {name: team_id for team_id, name, _ in teams},
+        'names': {team_id: name for team_id, name, _ in teams},
+        'by_abbr': {abbr: team_id for team_id, _, abbr in teams if abbr},
+        'by_slug': by_slug,
+        'by_nickname': by_nickname,
+        'teams': [(team_id, name) for team_id, name, _ in teams],
+        # One matcher per full name / nickname: SequenceMatcher indexes its
+        # second sequence, so that work is done once instead of on every compare
+        'fuzzy': [
+            (team_id,
+             SequenceMatcher(None, '', name.lower()),
+             SequenceMatcher(None, '', name.split()[-1].lower()))
+            for team_id, name, _ in teams
+        ],
+        'resolved': {},  # raw JSON name -> team_id (or None), filled by get_team_id
+    }
 
-def get_team_id(cur, team_name):
-    """Get team_id from teams table, matching various name formats with OCR error correction"""
+def get_team_id(team_index, team_name):
+    """Get team_id from the preloaded team index, resolving each distinct name once"""
+    resolved = team_index['resolved']
+    if team_name not in resolved:
+        resolved[team_name] = _resolve_team_id(team_index, team_name)
+    return resolved[team_name]
+
+def _resolve_team_id(team_index, team_name):
+    """Match a team name against the index, handling various name formats and OCR errors"""
     if not team_name:
         return None
     
     # Clean up team name - remove extra spaces
     team_name = team_name.strip()
+    by_name = team_index['by_name']
+    teams = team_index['teams']
     
     # Try exact match first
-    cur.execute("SELECT team_id FROM teams WHERE team_name = %s", (team_name,))
-    result = cur.fetchone()
-    if result:
-        return result[0]
+    if team_name in by_name:
+        return by_name[team_name]
     
     # Try abbreviation match
-    cur.execute("SELECT team_id FROM teams WHERE abbreviation = %s", (team_name,))
-    result = cur.fetchone()
-    if result:
-        return result[0]
+    if team_name in team_index['by_abbr']:
+        return team_index['by_abbr'][team_name]
     
-    # Try OCR correction mapping (with normalized spacing)
+    # Try the normalized name / nickname ("lakers", "LOS ANGELES LAKERS")
     normalized_name = ' '.join(team_name.lower().split())
+    team_id = team_index['by_slug'].get(normalized_name)
+    if team_id is not None:
+        return team_id
+    
+    # Try OCR correction mapping (with normalized spacing)
     corrected_name = OCR_CORRECTIONS.get(normalized_name)
     if corrected_name:
         # Try the corrected name
-        cur.execute("SELECT team_id FROM teams WHERE team_name = %s", (corrected_name,))
-        result = cur.fetchone()
-        if result:
-            return result[0]
+        if corrected_name in by_name:
+            return by_name[corrected_name]
         # Try partial match with corrected name
-        cur.execute("SELECT team_id FROM teams WHERE team_name LIKE %s", (f'%{corrected_name}%',))
-        result = cur.fetchone()
-        if result:
-            return result[0]
+        for team_id, db_team_name in teams:
+            if corrected_name in db_team_name:
+                return team_id
     
     # Try partial match (for names like "Lakers" vs "Los Angeles Lakers")
-    cur.execute("SELECT team_id FROM teams WHERE team_name LIKE %s", (f'%{team_name}%',))
-    result = cur.fetchone()
-    if result:
-        return result[0]
+    for team_id, db_team_name in teams:
+        if team_name in db_team_name:
+            return team_id
     
-    # If still not found, try reverse partial match
-    cur.execute("SELECT team_id, team_name FROM teams")
-    for row in cur.fetchall():
-        if team_name in row[1] or row[1].split()[-1] == team_name.split()[-1]:
-            return row[0]
+    # If still not found, try matching on the last word
+    if team_name:
+        team_id = team_index['by_nickname'].get(team_name.split()[-1])
+        if team_id is not None:
+            return team_id
     
     # Try fuzzy matching as last resort (similarity > 75%)
-    cur.execute("SELECT team_id, team_name FROM teams")
-    all_teams = cur.fetchall()
     best_match = None
     best_ratio = 0.75  # Minimum threshold
-    
-    for team_id, db_team_name in all_teams:
-        # Compare with full name
-        ratio = similarity_ratio(team_name, db_team_name)
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = team_id
-        
-        # Compare with nickname (last word)
-        nickname = db_team_name.split()[-1]
-        ratio = similarity_ratio(team_name, nickname)
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = team_id
+    team_lower = team_name.lower()
+    la = len(team_lower)
+    
+    for team_id, full_matcher, nickname_matcher in team_index['fuzzy']:
+        # Compare with full name, then with nickname (last word)
+        for matcher in (full_matcher, nickname_matcher):
+            # ratio() = 2*matches/(la+lb) can't beat 2*min(la, lb)/(la+lb);
+            # skip pairs whose lengths alone rule out a better score
+            lb = len(matcher.b)
+            if 2.0 * min(la, lb) / (la + lb) <= best_ratio:
+                continue
+            matcher.set_seq1(team_lower)
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_match = team_id
     
     if best_match:
         return best_match
@@ -153,40 +228,72 @@ def get_team_id(cur, team_name):
     print(f"WARNING: Could not find team_id for '{team_name}' - skipping")
     return None
 
+def copy_rows(cur, table, columns, rows):
+    """Bulk-load rows with COPY ... FROM STDIN (CSV); None is written as NULL"""
+    buf = io.StringIO()
+    for row in rows:
+        # Quote every value so empty strings stay distinct from unquoted NULLs
+        buf.write(','.join(
+            '' if v is None else '"' + str(v).replace('"', '""') + '"' for v in row
+        ))
+        buf.write('\n')
+    buf.seek(0)
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+    )
+
+@lru_cache(maxsize=4096)
 def parse_salary(salary_str):
     """Parse salary string like '$40.54M' to numeric 40.54"""
     if not salary_str or salary_str == 'N/A':
         return None
     # Remove everything except digits and decimal point
-    numeric_str = re.sub(r'[^\d.]', '', salary_str)
+    numeric_str = salary_str.translate(_SALARY_TRANS)
+    if not numeric_str.isascii():
+        numeric_str = _SALARY_RE.sub('', numeric_str)
     try:
         return float(numeric_str) if numeric_str else None
     except ValueError:
         return None
 
+@lru_cache(maxsize=4096)
 def parse_round(round_str):
     """Convert round string '1st' or '2nd' to integer 1 or 2"""
     if not round_str:
         return None
+    round_num = _ROUND_MAP.get(round_str.strip().lower())
+    if round_num is not None:
+        return round_num
+    # Anything else (e.g. hand-edited "Round 2"): fall back to the digit scan
     if '1' in round_str:
         return 1
     elif '2' in round_str:
         return 2
     return None
 
+@lru_cache(maxsize=4096)
+def parse_year(year):
+    """Parse a draft year like '2027' (or 2027 / 2027.0) to int, None if it isn't a number"""
+    if isinstance(year, (int, float)):
+        try:
+            return int(year)
+        except (ValueError, OverflowError):  # NaN / inf
+            return None
+    if not isinstance(year, str) or not _YEAR_RE.fullmatch(year):
+        return None
+    return int(year)
+
+@lru_cache(maxsize=4096)
 def parse_record(record_str):
     """Parse record string like '20-11' to (wins=20, losses=11)"""
-    if not record_str or '-' not in record_str:
+    if not record_str:
         return None, None
-    parts = record_str.split('-')
-    try:
-        wins = int(parts[0])
-        losses = int(parts[1])
-        return wins, losses
-    except (ValueError, IndexError):
+    m = _RECORD_RE.fullmatch(record_str)
+    if not m:
         return None, None
+    return int(m[1]), int(m[2])
 
-def import_roster_players(conn, cur):
+def import_roster_players(cur, team_index):
     """Import roster players with UUID generation - replaces data only for teams in the new JSON"""
     json_file = Path('output/roster_players.json')
     if not json_file.exists():
@@ -195,50 +302,25 @@ def import_roster_players(conn, cur):
     
     print(f"\nImporting roster players from {json_file}...")
     
-    with open(json_file, 'r', encoding='utf-8') as f:
-        players = json.load(f)
+    players = load_json(json_file)
     
-    # Identify teams present in new data
+    # Resolve each row's team once, collecting the teams present in new data;
+    # rows are written after the per-team DELETE below
     new_teams = set()
-    for player in players:
-        team_id = get_team_id(cur, player.get('team', ''))
-        if team_id:
-            new_teams.add(team_id)
-    
-    # Delete existing data ONLY for teams in the new screenshot batch
-    # CASCADE will automatically delete contracts for these players
-    if new_teams:
-        cur.execute(
-            "DELETE FROM roster_players WHERE team_id = ANY(%s)",
-            (list(new_teams),)
-        )
-        cur.execute("SELECT team_name FROM teams WHERE team_id = ANY(%s)", (list(new_teams),))
-        team_names = [row[0] for row in cur.fetchall()]
-        print(f"✓ Cleared roster data for {len(new_teams)} team(s): {', '.join(team_names)}")
-    else:
-        print("⚠ No valid teams found in new data")
-    
-    imported = 0
+    rows = []
     skipped = 0
     
     for player in players:
-        team_id = get_team_id(cur, player.get('team', ''))
+        team_id = get_team_id(team_index, player.get('team', ''))
         if not team_id:
             skipped += 1
             continue
+        new_teams.add(team_id)
         
-        # Get the correct team name from database
-        cur.execute("SELECT team_name FROM teams WHERE team_id = %s", (team_id,))
-        correct_team_name = cur.fetchone()[0]
+        # Get the correct team name from the team index
+        correct_team_name = team_index['names'][team_id]
         
-        # Insert with UUID auto-generation
-        cur.execute("""
-            INSERT INTO roster_players (
-                name, team_id, team, position, age, overall_rating,
-                delta, delta_string, source_filename,
-                source_y0, source_y1, name_confidence
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
+        rows.append((
             player.get('name'),
             team_id,
             correct_team_name,  # Use corrected name from database
@@ -252,12 +334,29 @@ def import_roster_players(conn, cur):
             player.get('y1'),
             player.get('name_conf')  # JSON uses 'name_conf'
         ))
-        imported += 1
     
-    conn.commit()
-    print(f"✓ Imported {imported} players (skipped {skipped})")
+    # Delete existing data ONLY for teams in the new screenshot batch
+    # CASCADE will automatically delete contracts for these players
+    if new_teams:
+        cur.execute(
+            "DELETE FROM roster_players WHERE team_id = ANY(%s)",
+            (list(new_teams),)
+        )
+        team_names = [team_index['names'][t] for t in sorted(new_teams)]
+        print(f"✓ Cleared roster data for {len(new_teams)} team(s): {', '.join(team_names)}")
+    else:
+        print("⚠ No valid teams found in new data")
+    
+    # Stream in with COPY; player_id UUIDs come from the column default
+    copy_rows(cur, 'roster_players', (
+        'name', 'team_id', 'team', 'position', 'age', 'overall_rating',
+        'delta', 'delta_string', 'source_filename',
+        'source_y0', 'source_y1', 'name_confidence'
+    ), rows)
+    
+    print(f"✓ Imported {len(rows)} players (skipped {skipped})")
 
-def import_contracts(conn, cur):
+def import_contracts(cur, team_index):
     """Import contracts linked to players via UUID
     
     Note: Contracts are automatically deleted when roster_players are deleted (CASCADE),
@@ -270,14 +369,17 @@ def import_contracts(conn, cur):
     
     print(f"\nImporting contracts from {json_file}...")
     
-    with open(json_file, 'r', encoding='utf-8') as f:
-        contracts = json.load(f)
+    contracts = load_json(json_file)
     
-    imported = 0
+    # One query for every (name, team) -> player_id, including rows just imported
+    cur.execute("SELECT player_id, name, team_id FROM roster_players")
+    player_index = {(name, team_id): player_id for player_id, name, team_id in cur}
+    
+    rows = []
     skipped = 0
     
     for contract in contracts:
-        team_id = get_team_id(cur, contract.get('team', ''))
+        team_id = get_team_id(team_index, contract.get('team', ''))
         if not team_id:
             skipped += 1
             continue
@@ -290,12 +392,7 @@ def import_contracts(conn, cur):
             continue
         
         # Find player_id by name and team
-        cur.execute("""
-            SELECT player_id FROM roster_players 
-            WHERE name = %s AND team_id = %s
-        """, (player_name, team_id))
-        result = cur.fetchone()
-        player_id = result[0] if result else None
+        player_id = player_index.get((player_name, team_id))
         
         # Parse salary to numeric
         salary = contract.get('salary', '')
@@ -305,13 +402,7 @@ def import_contracts(conn, cur):
         ntc_str = contract.get('ntc', '').strip().upper()
         no_trade_clause = ntc_str == 'YES'
         
-        cur.execute("""
-            INSERT INTO contracts (
-                player_id, player_name, team_id, team, salary, salary_numeric,
-                contract_option, signing_status, extension_status,
-                no_trade_clause, source_filename
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
+        rows.append((
             player_id,  # May be NULL if player not in roster
             player_name,
             team_id,
@@ -324,12 +415,16 @@ def import_contracts(conn, cur):
             no_trade_clause,
             contract.get('source')  # JSON uses 'source'
         ))
-        imported += 1
     
-    conn.commit()
-    print(f"✓ Imported {imported} contracts (skipped {skipped})")
+    copy_rows(cur, 'contracts', (
+        'player_id', 'player_name', 'team_id', 'team', 'salary', 'salary_numeric',
+        'contract_option', 'signing_status', 'extension_status',
+        'no_trade_clause', 'source_filename'
+    ), rows)
+    
+    print(f"✓ Imported {len(rows)} contracts (skipped {skipped})")
 
-def import_draft_picks(conn, cur):
+def import_draft_picks(cur, team_index):
     """Import draft picks with team references - replaces data only for teams in the new JSON"""
     json_file = Path('output/draft_picks.json')
     if not json_file.exists():
@@ -338,54 +433,24 @@ def import_draft_picks(conn, cur):
     
     print(f"\nImporting draft picks from {json_file}...")
     
-    with open(json_file, 'r', encoding='utf-8') as f:
-        picks = json.load(f)
+    picks = load_json(json_file)
     
-    # Identify teams present in new data
+    # Resolve each row's team once, collecting the teams present in new data;
+    # rows are written after the per-team DELETE below
     new_teams = set()
-    for pick in picks:
-        team_id = get_team_id(cur, pick.get('team', ''))
-        if team_id:
-            new_teams.add(team_id)
-    
-    # Delete existing draft picks ONLY for teams in the new screenshot batch
-    if new_teams:
-        cur.execute(
-            "DELETE FROM draft_picks WHERE team_id = ANY(%s)",
-            (list(new_teams),)
-        )
-        cur.execute("SELECT team_name FROM teams WHERE team_id = ANY(%s)", (list(new_teams),))
-        team_names = [row[0] for row in cur.fetchall()]
-        print(f"✓ Cleared draft picks for {len(new_teams)} team(s): {', '.join(team_names)}")
-    else:
-        print("⚠ No valid teams found in new data")
-    
-    imported = 0
+    rows = []
     skipped = 0
     
     for pick in picks:
-        team_id = get_team_id(cur, pick.get('team', ''))
+        team_id = get_team_id(team_index, pick.get('team', ''))
         if not team_id:
             skipped += 1
             continue
+        new_teams.add(team_id)
         
-        # Get the correct team name from database
-        cur.execute("SELECT team_name FROM teams WHERE team_id = %s", (team_id,))
-        correct_team_name = cur.fetchone()[0]
-        
-        origin_team_id = get_team_id(cur, pick.get('origin', '')) if pick.get('origin') else None
-        correct_origin_name = None
-        if origin_team_id:
-            cur.execute("SELECT team_name FROM teams WHERE team_id = %s", (origin_team_id,))
-            correct_origin_name = cur.fetchone()[0]
-        
-        # Parse year to int
-        try:
-            year = int(pick.get('year', 0))
-            if year < 2026:
-                skipped += 1
-                continue
-        except (ValueError, TypeError):
+        # Drop rows with a bad year or round before any further lookups
+        year = parse_year(pick.get('year', 0))
+        if year is None or year < 2026:
             skipped += 1
             continue
         
@@ -395,12 +460,15 @@ def import_draft_picks(conn, cur):
             skipped += 1
             continue
         
-        cur.execute("""
-            INSERT INTO draft_picks (
-                team_id, team, draft_year, round, pick_number,
-                protection, origin_team_id, origin_team, source_filename
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
+        # Get the correct team name from the team index
+        correct_team_name = team_index['names'][team_id]
+        
+        origin_team_id = get_team_id(team_index, pick.get('origin', '')) if pick.get('origin') else None
+        correct_origin_name = None
+        if origin_team_id:
+            correct_origin_name = team_index['names'][origin_team_id]
+        
+        rows.append((
             team_id,
             correct_team_name,  # Use corrected name from database
             year,
@@ -411,12 +479,26 @@ def import_draft_picks(conn, cur):
             correct_origin_name,  # Use corrected origin name from database
             pick.get('source')  # JSON uses 'source'
         ))
-        imported += 1
     
-    conn.commit()
-    print(f"✓ Imported {imported} draft picks (skipped {skipped})")
+    # Delete existing draft picks ONLY for teams in the new screenshot batch
+    if new_teams:
+        cur.execute(
+            "DELETE FROM draft_picks WHERE team_id = ANY(%s)",
+            (list(new_teams),)
+        )
+        team_names = [team_index['names'][t] for t in sorted(new_teams)]
+        print(f"✓ Cleared draft picks for {len(new_teams)} team(s): {', '.join(team_names)}")
+    else:
+        print("⚠ No valid teams found in new data")
+    
+    copy_rows(cur, 'draft_picks', (
+        'team_id', 'team', 'draft_year', 'round', 'pick_number',
+        'protection', 'origin_team_id', 'origin_team', 'source_filename'
+    ), rows)
+    
+    print(f"✓ Imported {len(rows)} draft picks (skipped {skipped})")
 
-def import_standings(conn, cur):
+def import_standings(cur, team_index):
     """Import standings with team references - replaces data only for teams in the new JSON"""
     json_file = Path('output/standings.json')
     if not json_file.exists():
@@ -425,24 +507,25 @@ def import_standings(conn, cur):
     
     print(f"\nImporting standings from {json_file}...")
     
-    with open(json_file, 'r', encoding='utf-8') as f:
-        standings = json.load(f)
+    standings = load_json(json_file)
     
     # Use the default season from schema
     current_season = '2025-26'
     
+    # Keyed by team_id: a single upsert statement can't touch the same row twice,
+    # so a team seen more than once keeps its last record (as sequential upserts did)
+    rows = {}
     imported = 0
     skipped = 0
     
     for standing in standings:
-        team_id = get_team_id(cur, standing.get('team', ''))
+        team_id = get_team_id(team_index, standing.get('team', ''))
         if not team_id:
             skipped += 1
             continue
         
-        # Get the correct team name from database
-        cur.execute("SELECT team_name FROM teams WHERE team_id = %s", (team_id,))
-        correct_team_name = cur.fetchone()[0]
+        # Get the correct team name from the team index
+        correct_team_name = team_index['names'][team_id]
         
         # Parse record to wins/losses
         record = standing.get('record', '')
@@ -452,11 +535,25 @@ def import_standings(conn, cur):
             skipped += 1
             continue
         
-        cur.execute("""
+        rows[team_id] = (
+            team_id,
+            correct_team_name,  # Use corrected name from database
+            standing.get('conference'),
+            standing.get('rank'),  # JSON uses 'rank'
+            standing.get('power_rank'),
+            wins,
+            losses,
+            standing.get('source'),  # JSON uses 'source'
+            current_season
+        )
+        imported += 1
+    
+    if rows:
+        execute_values(cur, """
             INSERT INTO standings (
                 team_id, team, conference, conference_rank,
                 power_rank, wins, losses, source_filename, season
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ) VALUES %s
             ON CONFLICT (team_id, season) 
             DO UPDATE SET
                 team = EXCLUDED.team,
@@ -467,20 +564,8 @@ def import_standings(conn, cur):
                 losses = EXCLUDED.losses,
                 source_filename = EXCLUDED.source_filename,
                 extracted_at = CURRENT_TIMESTAMP
-        """, (
-            team_id,
-            correct_team_name,  # Use corrected name from database
-            standing.get('conference'),
-            standing.get('rank'),  # JSON uses 'rank'
-            standing.get('power_rank'),
-            wins,
-            losses,
-            standing.get('source'),  # JSON uses 'source'
-            current_season
-        ))
-        imported += 1
+        """, list(rows.values()), page_size=INSERT_PAGE_SIZE)
     
-    conn.commit()
     print(f"✓ Imported/Updated {imported} standings for season {current_season} (skipped {skipped})")
 
 def main():
@@ -500,52 +585,58 @@ def main():
         return
     
     try:
+        # Everything below is one transaction. The import can simply be re-run,
+        # so don't wait for the WAL flush on commit
+        cur.execute("SET LOCAL synchronous_commit = off")
+        
+        # One query for the whole teams table; every lookup after this is in memory
+        team_index = build_team_index(cur)
+        
         # Import in order (roster first for player UUIDs)
-        import_roster_players(conn, cur)
-        import_contracts(conn, cur)
-        import_draft_picks(conn, cur)
-        import_standings(conn, cur)
+        import_roster_players(cur, team_index)
+        import_contracts(cur, team_index)
+        import_draft_picks(cur, team_index)
+        import_standings(cur, team_index)
+        
+        # All four imports land in one transaction
+        conn.commit()
         
         # Show final counts and team coverage
         print("\n" + "=" * 60)
         print("Import Summary:")
         print("=" * 60)
         
-        cur.execute("SELECT COUNT(*) FROM roster_players")
-        print(f"Roster players: {cur.fetchone()[0]}")
-        
-        cur.execute("SELECT COUNT(*) FROM contracts")
-        print(f"Contracts: {cur.fetchone()[0]}")
-        
-        cur.execute("SELECT COUNT(*) FROM draft_picks")
-        print(f"Draft picks: {cur.fetchone()[0]}")
-        
-        cur.execute("SELECT COUNT(*) FROM standings")
-        print(f"Standings: {cur.fetchone()[0]}")
+        cur.execute("""
+            SELECT (SELECT COUNT(*) FROM roster_players),
+                   (SELECT COUNT(*) FROM contracts),
+                   (SELECT COUNT(*) FROM draft_picks),
+                   (SELECT COUNT(*) FROM standings)
+        """)
+        roster_count, contract_count, pick_count, standings_count = cur.fetchone()
+        print(f"Roster players: {roster_count}")
+        print(f"Contracts: {contract_count}")
+        print(f"Draft picks: {pick_count}")
+        print(f"Standings: {standings_count}")
         
         # Show team coverage
         print("\n" + "=" * 60)
         print("Team Coverage:")
         print("=" * 60)
         
-        # Teams with roster data
+        # Every team with a flag for whether it has roster data
         cur.execute("""
-            SELECT DISTINCT t.team_name 
-            FROM teams t 
-            INNER JOIN roster_players rp ON t.team_id = rp.team_id 
+            SELECT t.team_name,
+                   EXISTS (SELECT 1 FROM roster_players rp WHERE rp.team_id = t.team_id)
+            FROM teams t
             ORDER BY t.team_name
         """)
-        teams_with_data = [row[0] for row in cur.fetchall()]
+        coverage = cur.fetchall()
+        teams_with_data = [name for name, has_roster in coverage if has_roster]
         print(f"Teams in database: {len(teams_with_data)} of 30")
         
         if len(teams_with_data) < 30:
             # Show missing teams
-            cur.execute("""
-                SELECT team_name FROM teams 
-                WHERE team_id NOT IN (SELECT DISTINCT team_id FROM roster_players)
-                ORDER BY team_name
-            """)
-            missing_teams = [row[0] for row in cur.fetchall()]
+            missing_teams = [name for name, has_roster in coverage if not has_roster]
             if missing_teams:
                 print(f"Teams missing roster data: {', '.join(missing_teams)}")
         
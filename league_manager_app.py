@@ -9,25 +9,188 @@ import subprocess
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QTableWidget, QTableWidgetItem, QLabel, QPushButton,
+    QTabWidget, QTableView, QLabel, QPushButton,
     QComboBox, QLineEdit, QStatusBar, QMessageBox, QHeaderView,
     QMenu, QMenuBar, QFileDialog, QGroupBox, QSplitter, QProgressDialog
 )
-from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+    QThreadPool, QProcess, QProcessEnvironment, pyqtSignal
+)
 from PyQt6.QtGui import QAction, QIcon, QFont, QColor
 
 import db_config
 
+# Worker threads for database reads; the connection pool gets one extra
+# connection for the few queries that still run on the GUI thread
+DB_WORKER_THREADS = 4
+
+# Helper scripts run with the same (virtual environment) Python as the app
+APP_DIR = Path(__file__).parent
+PYTHON_EXE = str(Path(sys.executable))
+IMPORT_SCRIPT = APP_DIR / "import_to_database_v2.py"
+EXPORT_SCRIPT = APP_DIR / "export_league_state.py"
+EXPORT_DIR = APP_DIR / "league_exports"
+
+# Fixed starting widths per column (None = stretch). Sizing sections with
+# ResizeToContents makes Qt format and measure every row on each reload.
+ROSTER_COLUMN_WIDTHS = [None, 50, 50, 50, 70, 180, 200]
+CONTRACTS_COLUMN_WIDTHS = [None, 90, 80, 110, 110, 50, 180]
+DRAFT_PICKS_COLUMN_WIDTHS = [60, 60, 50, None, 180, 180]
+STANDINGS_COLUMN_WIDTHS = [50, None, 100, 70, 70, 90]
+SALARY_CAP_COLUMN_WIDTHS = [None, 100, 100, 100, 70, 100]
+
+
+def _set_column_widths(table, widths):
+    """Apply fixed, user-resizable column widths to a table header"""
+    header = table.horizontalHeader()
+    for i, width in enumerate(widths):
+        if width is None:
+            header.setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
+        else:
+            header.setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(i, width)
+
+
+def _fmt_default(value):
+    return str(value) if value is not None else ""
+
+def _fmt_yes_no(value):
+    return "Yes" if value else "No"
+
+_ROUND_NAMES = {1: "1st", 2: "2nd"}
+
+def _fmt_round(value):
+    # Format round as "1st" or "2nd"
+    name = _ROUND_NAMES.get(value)
+    return name if name is not None else _fmt_default(value)
+
+def _fmt_millions(value):
+    return f"${value:.2f}M" if value is not None else "$0.00M"
+
+
+class RowsModel(QAbstractTableModel):
+    """Read-only table model over database rows.
+
+    Keeps the fetched tuples as-is and formats a cell only when the view asks
+    for it, so loading a table costs one list assignment instead of a
+    QTableWidgetItem per cell. Sorting uses the raw values (numbers sort as
+    numbers), NULLs last.
+    """
+    
+    def __init__(self, headers, formatters=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._formatters = [
+            (formatters or {}).get(c, _fmt_default) for c in range(len(self._headers))
+        ]
+        self._rows = []
+        self._sort = None
+        
+    def set_rows(self, rows):
+        """Replace the model contents, keeping the current sort order"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        if self._sort:
+            self._sort_rows(*self._sort)
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        column = index.column()
+        return self._formatters[column](self._rows[index.row()][column])
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0:
+            return
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows(column, order)
+        self.layoutChanged.emit()
+        
+    def _sort_rows(self, column, order):
+        rows = self._rows
+        present = [r for r in rows if r[column] is not None]
+        present.sort(key=lambda r: r[column],
+                     reverse=order == Qt.SortOrder.DescendingOrder)
+        rows[:] = present + [r for r in rows if r[column] is None]
+
+
+def _run_query(pool, sql, params):
+    """Run a read query on a pooled connection and return all rows"""
+    conn = pool.getconn()
+    try:
+        # Read-only queries; don't leave pooled connections idle in a transaction
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+    finally:
+        pool.putconn(conn)
+
+
+class _QuerySignals(QObject):
+    """Carries QueryWorker results back to the GUI thread"""
+    finished = pyqtSignal(str, object, object)  # target, token, rows
+    failed = pyqtSignal(str, object, str)       # target, token, error
+
+
+class QueryWorker(QRunnable):
+    """Runs one read query on a QThreadPool thread"""
+    
+    def __init__(self, pool, target, token, signals):
+        super().__init__()
+        self.pool = pool
+        self.target = target
+        self.token = token  # ((sql, params), cache generation)
+        self.signals = signals
+        
+    def run(self):
+        sql, params = self.token[0]
+        try:
+            rows = _run_query(self.pool, sql, params)
+        except Exception as e:
+            self.signals.failed.emit(self.target, self.token, str(e))
+        else:
+            self.signals.finished.emit(self.target, self.token, rows)
+
 
 class LeagueManagerApp(QMainWindow):
     """Main application window for NBA 2K26 League Manager"""
     
     def __init__(self):
         super().__init__()
-        self.conn = None
-        self.cur = None
+        self.pool = None
         self.current_team = None
         self.teams = []
+        self._teams_lower = []
+        # (sql, params) -> rows; cleared on refresh and after an import
+        self._query_cache = {}
+        self._cache_generation = 0
+        
+        # Background queries: only the newest request per target is shown
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(DB_WORKER_THREADS)
+        self._query_signals = _QuerySignals(self)
+        self._query_signals.finished.connect(self._on_query_finished)
+        self._query_signals.failed.connect(self._on_query_failed)
+        self._latest_query = {}
+        self._query_handlers = {}
+        
+        # Running import/export script, if any
+        self._script_proc = None
         
         self.init_ui()
         self.connect_database()
@@ -139,14 +302,27 @@ class LeagueManagerApp(QMainWindow):
         # Search box
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search teams...")
-        self.search_box.textChanged.connect(self.filter_teams)
+        self.search_box.textChanged.connect(self.schedule_team_filter)
         sidebar_layout.addWidget(self.search_box)
         
+        # Filter once typing pauses instead of rebuilding the combo per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_teams)
+        
         # Team selector
         self.team_combo = QComboBox()
-        self.team_combo.currentTextChanged.connect(self.on_team_selected)
+        self.team_combo.currentTextChanged.connect(self.schedule_team_selected)
         sidebar_layout.addWidget(self.team_combo)
         
+        # Coalesce bursts of selection changes (e.g. while the combo is refilled)
+        self._team_timer = QTimer(self)
+        self._team_timer.setSingleShot(True)
+        self._team_timer.setInterval(50)
+        self._team_timer.timeout.connect(
+            lambda: self.on_team_selected(self.team_combo.currentText()))
+        
         # Quick stats group
         stats_group = QGroupBox("Quick Stats")
         stats_layout = QVBoxLayout()
@@ -204,6 +380,14 @@ class LeagueManagerApp(QMainWindow):
         self.tabs.addTab(self.standings_tab, "🏆 Standings")
         self.tabs.addTab(self.salary_cap_tab, "💵 Salary Cap")
         
+        # Only the visible tab is loaded; the others reload when shown
+        self._tab_loaders = [
+            self.load_roster, self.load_contracts, self.load_draft_picks,
+            self.load_standings, self.load_salary_cap
+        ]
+        self._tab_dirty = [True] * len(self._tab_loaders)
+        self.tabs.currentChanged.connect(self.load_tab_if_dirty)
+        
         content_layout.addWidget(self.tabs)
         
         return content
@@ -214,18 +398,15 @@ class LeagueManagerApp(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Table
-        self.roster_table = QTableWidget()
-        self.roster_table.setColumnCount(7)
-        self.roster_table.setHorizontalHeaderLabels([
+        self.roster_model = RowsModel([
             "Player", "Pos", "Age", "OVR", "Change", "Team", "Source"
-        ])
+        ], parent=self)
+        self.roster_table = QTableView()
+        self.roster_table.setModel(self.roster_model)
         
         # Make table sortable and resize columns
         self.roster_table.setSortingEnabled(True)
-        header = self.roster_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for i in range(1, 7):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        _set_column_widths(self.roster_table, ROSTER_COLUMN_WIDTHS)
         
         layout.addWidget(self.roster_table)
         
@@ -237,17 +418,14 @@ class LeagueManagerApp(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Table
-        self.contracts_table = QTableWidget()
-        self.contracts_table.setColumnCount(7)
-        self.contracts_table.setHorizontalHeaderLabels([
+        self.contracts_model = RowsModel([
             "Player", "Salary", "Option", "Years", "Extension", "NTC", "Team"
-        ])
+        ], {5: _fmt_yes_no}, parent=self)
+        self.contracts_table = QTableView()
+        self.contracts_table.setModel(self.contracts_model)
         
         self.contracts_table.setSortingEnabled(True)
-        header = self.contracts_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for i in range(1, 7):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        _set_column_widths(self.contracts_table, CONTRACTS_COLUMN_WIDTHS)
         
         layout.addWidget(self.contracts_table)
         
@@ -259,18 +437,14 @@ class LeagueManagerApp(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Table
-        self.draft_picks_table = QTableWidget()
-        self.draft_picks_table.setColumnCount(6)
-        self.draft_picks_table.setHorizontalHeaderLabels([
+        self.draft_picks_model = RowsModel([
             "Year", "Round", "Pick", "Protection", "Origin", "Team"
-        ])
+        ], {1: _fmt_round}, parent=self)
+        self.draft_picks_table = QTableView()
+        self.draft_picks_table.setModel(self.draft_picks_model)
         
         self.draft_picks_table.setSortingEnabled(True)
-        header = self.draft_picks_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-        for i in [1, 2, 4, 5]:
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        _set_column_widths(self.draft_picks_table, DRAFT_PICKS_COLUMN_WIDTHS)
         
         layout.addWidget(self.draft_picks_table)
         
@@ -286,24 +460,25 @@ class LeagueManagerApp(QMainWindow):
         conf_label = QLabel("Conference:")
         self.conf_combo = QComboBox()
         self.conf_combo.addItems(["All", "Eastern", "Western"])
-        self.conf_combo.currentTextChanged.connect(self.load_standings)
+        self.conf_combo.currentTextChanged.connect(self.schedule_standings)
+        self._standings_timer = QTimer(self)
+        self._standings_timer.setSingleShot(True)
+        self._standings_timer.setInterval(50)
+        self._standings_timer.timeout.connect(self.load_standings)
         conf_layout.addWidget(conf_label)
         conf_layout.addWidget(self.conf_combo)
         conf_layout.addStretch()
         layout.addLayout(conf_layout)
         
         # Table
-        self.standings_table = QTableWidget()
-        self.standings_table.setColumnCount(6)
-        self.standings_table.setHorizontalHeaderLabels([
+        self.standings_model = RowsModel([
             "Rank", "Team", "Conference", "W-L", "Win %", "Power Rank"
-        ])
+        ], parent=self)
+        self.standings_table = QTableView()
+        self.standings_table.setModel(self.standings_model)
         
         self.standings_table.setSortingEnabled(True)
-        header = self.standings_table.horizontalHeader()
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        for i in [0, 2, 3, 4, 5]:
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        _set_column_widths(self.standings_table, STANDINGS_COLUMN_WIDTHS)
         
         layout.addWidget(self.standings_table)
         
@@ -315,17 +490,14 @@ class LeagueManagerApp(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Table
-        self.salary_cap_table = QTableWidget()
-        self.salary_cap_table.setColumnCount(6)
-        self.salary_cap_table.setHorizontalHeaderLabels([
+        self.salary_cap_model = RowsModel([
             "Team", "Total Salary", "Avg Salary", "Max Salary", "Players", "Cap Space"
-        ])
+        ], {1: _fmt_millions, 2: _fmt_millions, 3: _fmt_millions, 5: _fmt_millions}, parent=self)
+        self.salary_cap_table = QTableView()
+        self.salary_cap_table.setModel(self.salary_cap_model)
         
         self.salary_cap_table.setSortingEnabled(True)
-        header = self.salary_cap_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for i in range(1, 6):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        _set_column_widths(self.salary_cap_table, SALARY_CAP_COLUMN_WIDTHS)
         
         layout.addWidget(self.salary_cap_table)
         
@@ -334,35 +506,99 @@ class LeagueManagerApp(QMainWindow):
     def connect_database(self):
         """Connect to PostgreSQL database"""
         try:
-            self.conn = db_config.get_connection()
-            self.cur = self.conn.cursor()
+            self.pool = db_config.create_pool(minconn=1, maxconn=DB_WORKER_THREADS + 1)
             self.statusBar.showMessage("Connected to database")
         except Exception as e:
             QMessageBox.critical(self, "Database Error", 
                                f"Failed to connect to database:\n{str(e)}")
             self.statusBar.showMessage("Database connection failed")
             
+    def _fetch(self, sql, params=()):
+        """Run a read query, reusing the rows of an identical earlier call"""
+        key = (sql, params)
+        rows = self._query_cache.get(key)
+        if rows is None:
+            rows = self._query_cache[key] = _run_query(self.pool, sql, params)
+        return rows
+    
+    def _fetch_async(self, target, sql, params, on_rows):
+        """Fetch rows on the worker pool and hand them to on_rows on the GUI thread.
+        
+        A newer request for the same target supersedes older ones, so a slow
+        query for a previously selected team never overwrites the current one.
+        """
+        key = (sql, params)
+        token = (key, self._cache_generation)
+        self._latest_query[target] = token
+        self._query_handlers[target] = on_rows
+        
+        rows = self._query_cache.get(key)
+        if rows is not None:
+            on_rows(rows)
+            return
+        self._thread_pool.start(QueryWorker(self.pool, target, token, self._query_signals))
+        
+    def _on_query_finished(self, target, token, rows):
+        """Cache a background query's rows and show them if still current"""
+        key, generation = token
+        # Results of queries started before a refresh are stale
+        if generation == self._cache_generation:
+            self._query_cache[key] = rows
+        if self._latest_query.get(target) == token:
+            self._query_handlers[target](rows)
+            
+    def _on_query_failed(self, target, token, error):
+        """Report a failed background query if it is still current"""
+        if self._latest_query.get(target) != token:
+            return
+        if target == "quick stats":
+            print(f"Error loading quick stats: {error}")
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to load {target}:\n{error}")
+            
     def load_teams(self):
         """Load team list from database"""
-        if not self.cur:
+        if not self.pool:
             return
             
         try:
-            self.cur.execute("SELECT team_name FROM teams ORDER BY team_name")
-            self.teams = [row[0] for row in self.cur.fetchall()]
+            rows = self._fetch("SELECT team_name FROM teams ORDER BY team_name")
+            teams = [row[0] for row in rows]
+            if teams == self.teams and self.team_combo.count():
+                # Unchanged since the last load; keep the combo and its selection
+                return
+            self.teams = teams
+            self._teams_lower = [(t, t.lower()) for t in self.teams]
             
+            # Refill without firing a selection change per intermediate item
+            self.team_combo.blockSignals(True)
             self.team_combo.clear()
             self.team_combo.addItems(["-- Select Team --"] + self.teams)
+            self.team_combo.blockSignals(False)
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load teams:\n{str(e)}")
             
-    def filter_teams(self, text):
+    def schedule_team_filter(self, text):
+        """Restart the search debounce timer"""
+        self._filter_timer.start()
+        
+    def schedule_team_selected(self, team_name):
+        """Restart the team selection debounce timer"""
+        self._team_timer.start()
+        
+    def schedule_standings(self, conference):
+        """Restart the standings debounce timer"""
+        self._standings_timer.start()
+        
+    def filter_teams(self):
         """Filter team list based on search text"""
+        text = self.search_box.text()
         self.team_combo.clear()
         
         if text:
-            filtered = [t for t in self.teams if text.lower() in t.lower()]
+            needle = text.lower()
+            filtered = [t for t, lower in self._teams_lower if needle in lower]
             self.team_combo.addItems(filtered)
         else:
             self.team_combo.addItems(["-- Select Team --"] + self.teams)
@@ -375,208 +611,194 @@ class LeagueManagerApp(QMainWindow):
         self.current_team = team_name
         self.team_header.setText(f"{team_name}")
         
-        # Load all data for selected team
-        self.load_roster()
-        self.load_contracts()
-        self.load_draft_picks()
+        # Team tabs reload when next shown; the sidebar stats always update
+        self._tab_dirty[0:3] = [True] * 3
+        self.load_tab_if_dirty(self.tabs.currentIndex())
         self.load_quick_stats()
         
+    def load_tab_if_dirty(self, index):
+        """Load a tab's data if it changed since it was last shown"""
+        if 0 <= index < len(self._tab_dirty) and self._tab_dirty[index]:
+            self._tab_dirty[index] = False
+            self._tab_loaders[index]()
+        
     def load_roster(self):
         """Load roster for current team"""
-        if not self.cur or not self.current_team:
+        if not self.pool or not self.current_team:
             return
             
-        try:
-            self.cur.execute("""
-                SELECT name, position, age, overall_rating, delta_string, team, source_filename
-                FROM roster_players
-                WHERE team = %s
-                ORDER BY overall_rating DESC
-            """, (self.current_team,))
-            
-            rows = self.cur.fetchall()
-            self.roster_table.setRowCount(len(rows))
-            
-            for i, row in enumerate(rows):
-                for j, value in enumerate(row):
-                    item = QTableWidgetItem(str(value) if value is not None else "")
-                    if j == 3:  # OVR column
-                        item.setData(Qt.ItemDataRole.UserRole, value)
-                    self.roster_table.setItem(i, j, item)
-                    
-            self.statusBar.showMessage(f"Loaded {len(rows)} players")
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load roster:\n{str(e)}")
+        self._fetch_async("roster", """
+            SELECT name, position, age, overall_rating, delta_string, team, source_filename
+            FROM roster_players
+            WHERE team = %s
+            ORDER BY overall_rating DESC
+        """, (self.current_team,), self._show_roster)
+        
+    def _show_roster(self, rows):
+        """Display fetched roster rows"""
+        self.roster_model.set_rows(rows)
+        self.statusBar.showMessage(f"Loaded {len(rows)} players")
             
     def load_contracts(self):
         """Load contracts for current team"""
-        if not self.cur or not self.current_team:
+        if not self.pool or not self.current_team:
             return
             
-        try:
-            self.cur.execute("""
-                SELECT player_name, salary, contract_option, signing_status, 
-                       extension_status, no_trade_clause, team
-                FROM contracts
-                WHERE team = %s
-                ORDER BY salary_numeric DESC NULLS LAST
-            """, (self.current_team,))
-            
-            rows = self.cur.fetchall()
-            self.contracts_table.setRowCount(len(rows))
-            
-            for i, row in enumerate(rows):
-                for j, value in enumerate(row):
-                    if j == 5:  # NTC column (boolean)
-                        item = QTableWidgetItem("Yes" if value else "No")
-                    else:
-                        item = QTableWidgetItem(str(value) if value is not None else "")
-                    self.contracts_table.setItem(i, j, item)
-                    
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load contracts:\n{str(e)}")
+        self._fetch_async("contracts", """
+            SELECT player_name, salary, contract_option, signing_status, 
+                   extension_status, no_trade_clause, team
+            FROM contracts
+            WHERE team = %s
+            ORDER BY salary_numeric DESC NULLS LAST
+        """, (self.current_team,), self.contracts_model.set_rows)
             
     def load_draft_picks(self):
         """Load draft picks for current team"""
-        if not self.cur or not self.current_team:
+        if not self.pool or not self.current_team:
             return
             
-        try:
-            self.cur.execute("""
-                SELECT draft_year, round, pick_number, protection, origin_team, team
-                FROM draft_picks
-                WHERE team = %s
-                ORDER BY draft_year, round, pick_number
-            """, (self.current_team,))
-            
-            rows = self.cur.fetchall()
-            self.draft_picks_table.setRowCount(len(rows))
-            
-            for i, row in enumerate(rows):
-                for j, value in enumerate(row):
-                    # Format round as "1st" or "2nd"
-                    if j == 1 and value:
-                        display_value = "1st" if value == 1 else "2nd" if value == 2 else str(value)
-                    else:
-                        display_value = str(value) if value is not None else ""
-                    item = QTableWidgetItem(display_value)
-                    self.draft_picks_table.setItem(i, j, item)
-                    
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load draft picks:\n{str(e)}")
+        self._fetch_async("draft picks", """
+            SELECT draft_year, round, pick_number, protection, origin_team, team
+            FROM draft_picks
+            WHERE team = %s
+            ORDER BY draft_year, round, pick_number
+        """, (self.current_team,), self.draft_picks_model.set_rows)
             
     def load_standings(self):
         """Load league standings"""
-        if not self.cur:
+        if not self.pool:
             return
             
-        try:
-            conference = self.conf_combo.currentText()
-            
-            if conference == "All":
-                self.cur.execute("""
-                    SELECT conference_rank, team, conference, wins, losses, 
-                           ROUND(wins::numeric / (wins + losses), 3) as win_pct, power_rank
-                    FROM standings
-                    ORDER BY conference, conference_rank
-                """)
-            else:
-                self.cur.execute("""
-                    SELECT conference_rank, team, conference, wins, losses,
-                           ROUND(wins::numeric / (wins + losses), 3) as win_pct, power_rank
-                    FROM standings
-                    WHERE conference = %s
-                    ORDER BY conference_rank
-                """, (conference,))
-            
-            rows = self.cur.fetchall()
-            self.standings_table.setRowCount(len(rows))
-            
-            for i, row in enumerate(rows):
-                for j, value in enumerate(row):
-                    if j == 3:  # W-L column
-                        wins, losses = value, row[4]
-                        item = QTableWidgetItem(f"{wins}-{losses}")
-                    elif j == 4:  # Skip losses (combined with wins)
-                        continue
-                    else:
-                        item = QTableWidgetItem(str(value) if value is not None else "")
-                    
-                    # Adjust column index after combining W-L
-                    col = j if j < 4 else j - 1
-                    self.standings_table.setItem(i, col, item)
-                    
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load standings:\n{str(e)}")
+        conference = self.conf_combo.currentText()
+        
+        if conference == "All":
+            self._fetch_async("standings", """
+                SELECT conference_rank, team, conference, wins || '-' || losses AS record,
+                       ROUND(wins::numeric / (wins + losses), 3) as win_pct, power_rank
+                FROM standings
+                ORDER BY conference, conference_rank
+            """, (), self.standings_model.set_rows)
+        else:
+            self._fetch_async("standings", """
+                SELECT conference_rank, team, conference, wins || '-' || losses AS record,
+                       ROUND(wins::numeric / (wins + losses), 3) as win_pct, power_rank
+                FROM standings
+                WHERE conference = %s
+                ORDER BY conference_rank
+            """, (conference,), self.standings_model.set_rows)
             
     def load_salary_cap(self):
         """Load salary cap data for all teams"""
-        if not self.cur:
+        if not self.pool:
             return
             
-        try:
-            self.cur.execute("""
-                SELECT team_name, total_salary, avg_salary, max_salary, player_count,
-                       150.0 - COALESCE(total_salary, 0.0) as cap_space
-                FROM team_salary_summary
-                ORDER BY total_salary DESC NULLS LAST
-            """)
-            
-            rows = self.cur.fetchall()
-            self.salary_cap_table.setRowCount(len(rows))
-            
-            for i, row in enumerate(rows):
-                for j, value in enumerate(row):
-                    if j in [1, 2, 3, 5]:  # Salary columns
-                        display_value = f"${value:.2f}M" if value is not None else "$0.00M"
-                    else:
-                        display_value = str(value) if value is not None else ""
-                    item = QTableWidgetItem(display_value)
-                    self.salary_cap_table.setItem(i, j, item)
-                    
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load salary cap data:\n{str(e)}")
+        self._fetch_async("salary cap data", """
+            SELECT team_name, total_salary, avg_salary, max_salary, player_count,
+                   150.0 - COALESCE(total_salary, 0.0) as cap_space
+            FROM team_salary_summary
+            ORDER BY total_salary DESC NULLS LAST
+        """, (), self.salary_cap_model.set_rows)
             
     def load_quick_stats(self):
         """Load quick stats for current team"""
-        if not self.cur or not self.current_team:
+        if not self.pool or not self.current_team:
             return
             
-        try:
-            # Roster count
-            self.cur.execute("SELECT COUNT(*) FROM roster_players WHERE team = %s", 
-                           (self.current_team,))
-            roster_count = self.cur.fetchone()[0]
-            self.roster_count_label.setText(f"Roster: {roster_count} players")
-            
-            # Total salary
-            self.cur.execute("""
-                SELECT COALESCE(SUM(salary_numeric), 0.0)
-                FROM contracts
-                WHERE team = %s
-            """, (self.current_team,))
-            total_salary = self.cur.fetchone()[0]
-            self.salary_total_label.setText(f"Total Salary: ${total_salary:.2f}M")
-            
-            # Draft picks count
-            self.cur.execute("SELECT COUNT(*) FROM draft_picks WHERE team = %s",
-                           (self.current_team,))
-            draft_count = self.cur.fetchone()[0]
-            self.draft_picks_label.setText(f"Draft Picks: {draft_count}")
-            
-        except Exception as e:
-            print(f"Error loading quick stats: {e}")
+        # Roster count, total salary and draft picks count in one round trip
+        self._fetch_async("quick stats", """
+            SELECT
+                (SELECT COUNT(*) FROM roster_players WHERE team = %s),
+                (SELECT COALESCE(SUM(salary_numeric), 0.0) FROM contracts WHERE team = %s),
+                (SELECT COUNT(*) FROM draft_picks WHERE team = %s)
+        """, (self.current_team,) * 3, self._show_quick_stats)
+        
+    def _show_quick_stats(self, rows):
+        """Display fetched quick stats"""
+        roster_count, total_salary, draft_count = rows[0]
+        self.roster_count_label.setText(f"Roster: {roster_count} players")
+        self.salary_total_label.setText(f"Total Salary: ${total_salary:.2f}M")
+        self.draft_picks_label.setText(f"Draft Picks: {draft_count}")
             
     def refresh_data(self):
         """Refresh all data"""
+        self._query_cache.clear()
+        self._cache_generation += 1
+        self._tab_dirty = [True] * len(self._tab_loaders)
         self.load_teams()
         if self.current_team:
             self.on_team_selected(self.current_team)
-        self.load_standings()
-        self.load_salary_cap()
+        self.load_tab_if_dirty(self.tabs.currentIndex())
         self.statusBar.showMessage("Data refreshed")
         
+    def _run_script(self, script, timeout_s, on_done):
+        """Run a helper script without blocking the UI.
+        
+        Output lines are shown in the status bar as they arrive. When the
+        script ends, on_done(status, stdout, stderr) is called with status
+        "ok", "failed", "timeout" or "error" (could not be started).
+        """
+        if self._script_proc is not None:
+            QMessageBox.information(self, "Busy", "An import or export is already running.")
+            return
+        
+        proc = QProcess(self)
+        env = QProcessEnvironment.systemEnvironment()
+        # Unbuffered UTF-8 output so progress arrives as it's printed
+        env.insert("PYTHONUNBUFFERED", "1")
+        env.insert("PYTHONIOENCODING", "utf-8")
+        proc.setProcessEnvironment(env)
+        self._script_proc = proc
+        
+        stdout, stderr = [], []
+        timed_out = []
+        timer = QTimer(proc)
+        timer.setSingleShot(True)
+        
+        def read_stdout():
+            text = bytes(proc.readAllStandardOutput()).decode("utf-8", errors="replace")
+            stdout.append(text)
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
+            if lines:
+                self.statusBar.showMessage(lines[-1])
+                
+        def read_stderr():
+            stderr.append(bytes(proc.readAllStandardError()).decode("utf-8", errors="replace"))
+            
+        def done(status):
+            timer.stop()
+            self._script_proc = None
+            proc.deleteLater()
+            on_done(status, "".join(stdout), "".join(stderr))
+            
+        def finished(exit_code, exit_status):
+            read_stdout()
+            read_stderr()
+            if timed_out:
+                done("timeout")
+            elif exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+                done("ok")
+            else:
+                done("failed")
+                
+        def error_occurred(error):
+            # Crashes and kills still emit finished(); only a failed start doesn't
+            if error == QProcess.ProcessError.FailedToStart:
+                stderr.append(proc.errorString())
+                done("error")
+                
+        def kill():
+            timed_out.append(True)
+            proc.kill()
+            
+        proc.readyReadStandardOutput.connect(read_stdout)
+        proc.readyReadStandardError.connect(read_stderr)
+        proc.finished.connect(finished)
+        proc.errorOccurred.connect(error_occurred)
+        timer.timeout.connect(kill)
+        
+        timer.start(timeout_s * 1000)
+        proc.start(PYTHON_EXE, [str(script)])
+        
     def import_data(self):
         """Run import from JSON files"""
         reply = QMessageBox.question(self, "Import Data",
@@ -584,42 +806,33 @@ class LeagueManagerApp(QMainWindow):
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.statusBar.showMessage("Importing data...")
-                
-                # Get Python executable path from virtual environment
-                python_exe = Path(sys.executable)
-                script_path = Path(__file__).parent / "import_to_database_v2.py"
-                
-                # Run import script
-                result = subprocess.run(
-                    [str(python_exe), str(script_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if result.returncode == 0:
-                    QMessageBox.information(self, "Import Successful",
-                                          f"Data imported successfully!\n\n{result.stdout}")
-                    self.statusBar.showMessage("Import completed successfully")
-                    # Auto-refresh after import
-                    QTimer.singleShot(500, self.refresh_data)
-                else:
-                    QMessageBox.warning(self, "Import Failed",
-                                      f"Import failed with error:\n\n{result.stderr}")
-                    self.statusBar.showMessage("Import failed")
-                    
-            except subprocess.TimeoutExpired:
-                QMessageBox.warning(self, "Timeout", "Import took too long and was cancelled.")
-                self.statusBar.showMessage("Import timeout")
-            except FileNotFoundError:
+            if not IMPORT_SCRIPT.exists():
                 QMessageBox.critical(self, "Error", 
-                                   f"Could not find import_to_database_v2.py\n\nExpected location: {script_path}")
+                                   f"Could not find import_to_database_v2.py\n\nExpected location: {IMPORT_SCRIPT}")
                 self.statusBar.showMessage("Import script not found")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to run import:\n\n{str(e)}")
-                self.statusBar.showMessage("Import error")
+                return
+            
+            self.statusBar.showMessage("Importing data...")
+            self._run_script(IMPORT_SCRIPT, 60, self._import_finished)
+            
+    def _import_finished(self, status, stdout, stderr):
+        """Report the result of an import run"""
+        if status == "ok":
+            QMessageBox.information(self, "Import Successful",
+                                  f"Data imported successfully!\n\n{stdout}")
+            self.statusBar.showMessage("Import completed successfully")
+            # Auto-refresh after import
+            QTimer.singleShot(500, self.refresh_data)
+        elif status == "timeout":
+            QMessageBox.warning(self, "Timeout", "Import took too long and was cancelled.")
+            self.statusBar.showMessage("Import timeout")
+        elif status == "error":
+            QMessageBox.critical(self, "Error", f"Failed to run import:\n\n{stderr}")
+            self.statusBar.showMessage("Import error")
+        else:
+            QMessageBox.warning(self, "Import Failed",
+                              f"Import failed with error:\n\n{stderr}")
+            self.statusBar.showMessage("Import failed")
             
     def export_data(self):
         """Export league state for ChatGPT"""
@@ -628,68 +841,59 @@ class LeagueManagerApp(QMainWindow):
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.statusBar.showMessage("Exporting league data...")
-                
-                # Get Python executable path from virtual environment
-                python_exe = Path(sys.executable)
-                script_path = Path(__file__).parent / "export_league_state.py"
-                
-                # Run export script
-                result = subprocess.run(
-                    [str(python_exe), str(script_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    export_dir = Path(__file__).parent / "league_exports"
-                    files_msg = "\n".join([
-                        "- 1_standings.txt",
-                        "- 2_salary_cap.txt",
-                        "- 3_rosters.txt",
-                        "- 4_draft_picks.txt"
-                    ])
-                    
-                    msg = QMessageBox()
-                    msg.setIcon(QMessageBox.Icon.Information)
-                    msg.setWindowTitle("Export Successful")
-                    msg.setText("League data exported successfully!")
-                    msg.setDetailedText(result.stdout)
-                    msg.setInformativeText(f"Files created in league_exports/:\n\n{files_msg}")
-                    
-                    # Add button to open folder
-                    open_btn = msg.addButton("Open Folder", QMessageBox.ButtonRole.ActionRole)
-                    msg.addButton(QMessageBox.StandardButton.Ok)
-                    
-                    msg.exec()
-                    
-                    if msg.clickedButton() == open_btn:
-                        # Open export directory in file explorer
-                        if sys.platform == 'win32':
-                            subprocess.run(['explorer', str(export_dir)])
-                        elif sys.platform == 'darwin':
-                            subprocess.run(['open', str(export_dir)])
-                        else:
-                            subprocess.run(['xdg-open', str(export_dir)])
-                    
-                    self.statusBar.showMessage("Export completed successfully")
-                else:
-                    QMessageBox.warning(self, "Export Failed",
-                                      f"Export failed with error:\n\n{result.stderr}")
-                    self.statusBar.showMessage("Export failed")
-                    
-            except subprocess.TimeoutExpired:
-                QMessageBox.warning(self, "Timeout", "Export took too long and was cancelled.")
-                self.statusBar.showMessage("Export timeout")
-            except FileNotFoundError:
+            if not EXPORT_SCRIPT.exists():
                 QMessageBox.critical(self, "Error", 
-                                   f"Could not find export_league_state.py\n\nExpected location: {script_path}")
+                                   f"Could not find export_league_state.py\n\nExpected location: {EXPORT_SCRIPT}")
                 self.statusBar.showMessage("Export script not found")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to run export:\n\n{str(e)}")
-                self.statusBar.showMessage("Export error")
+                return
+            
+            self.statusBar.showMessage("Exporting league data...")
+            self._run_script(EXPORT_SCRIPT, 30, self._export_finished)
+            
+    def _export_finished(self, status, stdout, stderr):
+        """Report the result of an export run"""
+        if status == "ok":
+            export_dir = EXPORT_DIR
+            files_msg = "\n".join([
+                "- 1_standings.txt",
+                "- 2_salary_cap.txt",
+                "- 3_rosters.txt",
+                "- 4_draft_picks.txt"
+            ])
+            
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Icon.Information)
+            msg.setWindowTitle("Export Successful")
+            msg.setText("League data exported successfully!")
+            msg.setDetailedText(stdout)
+            msg.setInformativeText(f"Files created in league_exports/:\n\n{files_msg}")
+            
+            # Add button to open folder
+            open_btn = msg.addButton("Open Folder", QMessageBox.ButtonRole.ActionRole)
+            msg.addButton(QMessageBox.StandardButton.Ok)
+            
+            msg.exec()
+            
+            if msg.clickedButton() == open_btn:
+                # Open export directory in file explorer
+                if sys.platform == 'win32':
+                    subprocess.run(['explorer', str(export_dir)])
+                elif sys.platform == 'darwin':
+                    subprocess.run(['open', str(export_dir)])
+                else:
+                    subprocess.run(['xdg-open', str(export_dir)])
+            
+            self.statusBar.showMessage("Export completed successfully")
+        elif status == "timeout":
+            QMessageBox.warning(self, "Timeout", "Export took too long and was cancelled.")
+            self.statusBar.showMessage("Export timeout")
+        elif status == "error":
+            QMessageBox.critical(self, "Error", f"Failed to run export:\n\n{stderr}")
+            self.statusBar.showMessage("Export error")
+        else:
+            QMessageBox.warning(self, "Export Failed",
+                              f"Export failed with error:\n\n{stderr}")
+            self.statusBar.showMessage("Export failed")
             
     def export_team(self):
         """Export current team data"""
@@ -765,15 +969,15 @@ class LeagueManagerApp(QMainWindow):
                 border-radius: 4px;
                 background-color: white;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #ddd;
                 background-color: white;
                 gridline-color: #e0e0e0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2196F3;
                 color: white;
             }
@@ -820,8 +1024,11 @@ class LeagueManagerApp(QMainWindow):
         
     def closeEvent(self, event):
         """Handle application close"""
-        if self.conn:
-            self.conn.close()
+        # Let in-flight queries return their connections before closing the pool
+        self._thread_pool.clear()
+        self._thread_pool.waitForDone()
+        if self.pool:
+            self.pool.closeall()
         event.accept()
 
 